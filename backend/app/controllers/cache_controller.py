@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends, status
+from app.core.cache.tiered import cache
+from app.core.security.dependencies import get_current_user
+from app.schemas.user import UserResponse
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK)
+async def get_cache_stats(
+    current_user: UserResponse = Depends(get_current_user)
+):
+    return {"success": True, "data": cache.stats()}
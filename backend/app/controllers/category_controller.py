@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from app.core.database.postgresql import get_async_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.category_service import CategoryService
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
 from app.core.security.dependencies import get_current_user
 from app.schemas.user import UserResponse
+from app.utils.response import ModelResponse
+from app.utils.etag import build_etag, etag_matches, etag_headers
 from app.utils.error_handler import get_db_error_message, get_exception_status_code
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -13,16 +15,27 @@ model_name = "Category"
 
 @router.get("/", response_model=CategoryResponse, status_code=status.HTTP_200_OK)
 async def get_all_categories(
+    request: Request,
     db: AsyncSession = Depends(get_async_session),
 ):
     try:
         category_service = CategoryService(db)
+
+        etag = None
+        try:
+            etag = build_etag("categories", await category_service.get_generation())
+        except Exception:
+            pass
+
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
         categories = await category_service.get_all_categories()
 
-        return CategoryResponse(
+        return ModelResponse(CategoryResponse(
             success=True,
             data=categories
-        )
+        ), status_code=status.HTTP_200_OK, headers=etag_headers(etag) if etag else None)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -40,10 +53,10 @@ async def create_category(
         category_service = CategoryService(db)
         category = await category_service.create_category(category_data)
 
-        return CategoryResponse(
+        return ModelResponse(CategoryResponse(
             success=True,
             data=category
-        )
+        ), status_code=status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -61,10 +74,10 @@ async def update_category(
         category_service = CategoryService(db)
         category = await category_service.update_category(category_id, category_data)
 
-        return CategoryResponse(
+        return ModelResponse(CategoryResponse(
             success=True,
             data=category
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -81,10 +94,10 @@ async def delete_category(
         category_service = CategoryService(db)
         category = await category_service.delete_category(category_id)
 
-        return CategoryResponse(
+        return ModelResponse(CategoryResponse(
             success=True,
             data=category
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -0,0 +1,100 @@
+import os
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from app.core.constants import IMAGE_VARIANT_WIDTHS
+from app.utils.etag import build_etag, etag_matches
+from app.utils.file_response import RangeFileResponse, parse_range
+from app.utils.image_variants import UPLOAD_DIR, SUPPORTED_FORMATS, variant_filename
+
+router = APIRouter(prefix="/uploads/products", tags=["images"])
+
+MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+}
+CONTENT_HASH = re.compile(r"^[0-9a-f]{64}$")
+NEGOTIATED_VARIANT = re.compile(rf"^([0-9a-f]+)_({'|'.join(IMAGE_VARIANT_WIDTHS)})$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _accepted_formats(accept: Optional[str]) -> List[str]:
+    accepted = set()
+    for media_range in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            if float(quality) > 0:
+                accepted.add(media_type.lower())
+        except ValueError:
+            continue
+
+    return [image_format for image_format in SUPPORTED_FORMATS if f"image/{image_format}" in accepted]
+
+
+def _find_original(stem: str) -> Optional[Path]:
+    for extension in MEDIA_TYPES:
+        path = UPLOAD_DIR / f"{stem}{extension}"
+        if path.is_file():
+            return path
+    return None
+
+
+def _resolve(filename: str, accept: Optional[str]) -> Tuple[Optional[Path], bool]:
+    variant = NEGOTIATED_VARIANT.match(filename)
+    if variant is None:
+        path = UPLOAD_DIR / filename
+        return (path if path.suffix.lower() in MEDIA_TYPES and path.is_file() else None), False
+
+    stem, name = variant.groups()
+    for image_format in _accepted_formats(accept):
+        path = UPLOAD_DIR / variant_filename(stem, name, image_format)
+        if path.is_file():
+            return path, True
+
+    return _find_original(stem), True
+
+
+@router.api_route("/{filename}", methods=["GET", "HEAD"])
+async def get_image(filename: str, request: Request):
+    if "/" in filename or filename.startswith("."):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    path, negotiated = await run_in_threadpool(_resolve, filename, request.headers.get("accept"))
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    stat = await run_in_threadpool(os.stat, path)
+    stem = path.stem.split("_")[0]
+
+    if CONTENT_HASH.match(stem):
+        etag = build_etag(path.stem, path.suffix.lstrip("."))
+        cache_control = IMMUTABLE if not negotiated or path.stem != stem else "no-cache"
+    else:
+        etag = build_etag(f"{stat.st_mtime_ns:x}", f"{stat.st_size:x}")
+        cache_control = "no-cache"
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if negotiated:
+        headers["Vary"] = "Accept"
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), stat.st_size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stat.st_size}"}
+            )
+
+    return RangeFileResponse(path, stat.st_size, MEDIA_TYPES[path.suffix.lower()], headers, byte_range)
@@ -1,30 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from app.core.database.postgresql import get_async_session
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Response, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.core.database.postgresql import get_async_session, async_session_maker
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.product_service import ProductService
-from app.schemas.product import ProductCreate, ProductResponse, ProductSizeAdd, ProductSizeUpdate
+from app.services.product_import_service import ProductImportService
+from app.services.product_export_service import ProductExportService
+from app.services.image_blob_service import ImageBlobService
+from app.schemas.product import ProductCreate, ProductResponse, ProductSizeAdd, ProductSizeUpdate, ProductFilter, ProductSort, ProductImportFormat, ProductImportResponse, ProductExportFormat, ProductSizeBatchUpdate, ProductSizeBatchResponse, StockSubscription
 from app.core.security.dependencies import get_current_user
 from app.schemas.user import UserResponse
+from app.utils.response import ModelResponse
 from app.utils.error_handler import get_db_error_message, get_exception_status_code
 from app.utils.file_handler import save_upload_file
+from app.utils.pagination import decode_cursor
+from app.utils.etag import build_etag, etag_matches, etag_headers
+from app.core.constants import PRODUCT_PAGE_SIZE, PRODUCT_MAX_PAGE_SIZE, PRODUCT_CHANGES_HEARTBEAT_INTERVAL
+from app.core.events.product_changes import product_change_feed
+from app.core.events.stock_channel import stock_channel, StockSubscriber
+from pydantic import ValidationError
 from typing import Optional
+import asyncio
+import hashlib
 
 router = APIRouter(prefix="/products", tags=["products"])
 
 model_name = "Product"
 
+CURSOR_KEY_TYPES = {
+    ProductSort.name: (str,),
+    ProductSort.price_asc: (int, float),
+    ProductSort.price_desc: (int, float),
+}
+
+async def _stream_product_lines(filters: ProductFilter, after: Optional[dict]):
+    async with async_session_maker() as db:
+        product_service = ProductService(db)
+        async for product_item in product_service.stream_products(filters, after):
+            yield product_item.model_dump_json() + "\n"
+
+
+async def _stream_product_export(filters: ProductFilter, export_format: ProductExportFormat, gzip: bool):
+    async with async_session_maker() as db:
+        product_export_service = ProductExportService(db)
+        async for chunk in product_export_service.export_products(filters, export_format, gzip):
+            yield chunk
+
+
+async def _stream_product_changes():
+    async with product_change_feed.subscribe() as queue:
+        yield f"retry: {PRODUCT_CHANGES_HEARTBEAT_INTERVAL * 1000}\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=PRODUCT_CHANGES_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"data: {payload}\n\n"
+
+
+async def _send_stock_updates(websocket: WebSocket, subscriber: StockSubscriber):
+    while True:
+        await websocket.send_json(await subscriber.next_message())
+
+
+async def _receive_stock_subscriptions(websocket: WebSocket, subscriber: StockSubscriber):
+    while True:
+        try:
+            subscription = StockSubscription.model_validate_json(await websocket.receive_text())
+            stock_channel.unsubscribe(subscriber, subscription.unsubscribe)
+            stock_channel.subscribe(subscriber, subscription.subscribe)
+        except (ValidationError, ValueError) as e:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+
+
 @router.get("/", response_model=ProductResponse, status_code=status.HTTP_200_OK)
 async def get_products(
+    request: Request,
+    limit: int = Query(PRODUCT_PAGE_SIZE, ge=1, le=PRODUCT_MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    stream: bool = False,
+    filters: ProductFilter = Depends(ProductFilter.as_query),
     db: AsyncSession = Depends(get_async_session),
 ):
+    try:
+        after_cursor = decode_cursor(after, CURSOR_KEY_TYPES.get(filters.sort, ()))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if stream:
+        return StreamingResponse(_stream_product_lines(filters, after_cursor), media_type="application/x-ndjson")
+
     try:
         product_service = ProductService(db)
-        product_items = await product_service.get_products()
 
-        return ProductResponse(
+        etag = None
+        try:
+            generation = await product_service.get_catalog_generation()
+            etag = build_etag("products", generation, hashlib.sha1(request.url.query.encode()).hexdigest()[:16])
+        except Exception:
+            pass
+
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+        product_items, next_cursor, facets = await product_service.get_products(filters, limit, after_cursor)
+
+        return ModelResponse(ProductResponse(
             success=True,
-            data=product_items
-        )
+            data=product_items,
+            next_cursor=next_cursor,
+            facets=facets
+        ), status_code=status.HTTP_200_OK, headers=etag_headers(etag) if etag else None)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -32,6 +118,54 @@ async def get_products(
         )
 
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_products(
+    format: ProductExportFormat = ProductExportFormat.csv,
+    gzip: bool = False,
+    filters: ProductFilter = Depends(ProductFilter.as_query),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    media_type = "text/csv" if format == ProductExportFormat.csv else "application/x-ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="products.{format.value}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(_stream_product_export(filters, format, gzip), media_type=media_type, headers=headers)
+
+
+@router.get("/changes", status_code=status.HTTP_200_OK)
+async def product_changes():
+    return StreamingResponse(
+        _stream_product_changes(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/live")
+async def live_stock(websocket: WebSocket):
+    await websocket.accept()
+    subscriber = stock_channel.connect()
+    sender = asyncio.create_task(_send_stock_updates(websocket, subscriber))
+    receiver = asyncio.create_task(_receive_stock_subscriptions(websocket, subscriber))
+
+    try:
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        failed = any(
+            not task.cancelled() and not isinstance(task.exception(), WebSocketDisconnect)
+            for task in done
+        )
+        if failed:
+            try:
+                await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+            except Exception:
+                pass
+    finally:
+        sender.cancel()
+        receiver.cancel()
+        stock_channel.disconnect(subscriber)
+
+
 @router.get("/search", response_model=ProductResponse, status_code=status.HTTP_200_OK)
 async def search_products(
     search_query: str,
@@ -39,12 +173,9 @@ async def search_products(
 ):
     try:
         product_service = ProductService(db)
-        product_items = await product_service.search_products(search_query)
+        response_body = await product_service.search_products(search_query)
 
-        return ProductResponse(
-            success=True,
-            data=product_items
-        )
+        return Response(content=response_body, media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -62,15 +193,63 @@ async def create_product(
     try:
         if image:
             image_filename = await save_upload_file(image)
+            await ImageBlobService(db).register_upload(image_filename)
             product_data.image = image_filename
 
         product_service = ProductService(db)
         product_item = await product_service.create_product(product_data)
 
-        return ProductResponse(
+        return ModelResponse(ProductResponse(
             success=True,
             data=product_item
+        ), status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
         )
+
+
+@router.post("/import", response_model=ProductImportResponse, status_code=status.HTTP_200_OK)
+async def import_products(
+    file: UploadFile = File(...),
+    format: Optional[ProductImportFormat] = None,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    if format is None:
+        is_ndjson = (file.filename or "").lower().endswith((".ndjson", ".jsonl"))
+        format = ProductImportFormat.ndjson if is_ndjson else ProductImportFormat.csv
+
+    try:
+        product_import_service = ProductImportService(db)
+        import_result = await product_import_service.import_products(file, format)
+
+        return ModelResponse(ProductImportResponse(
+            success=True,
+            data=import_result
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.put("/sizes/batch", response_model=ProductSizeBatchResponse, status_code=status.HTTP_200_OK)
+async def update_product_sizes_batch(
+    batch_data: ProductSizeBatchUpdate,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        product_service = ProductService(db)
+        batch_result = await product_service.update_product_sizes_batch(batch_data.items)
+
+        return ModelResponse(ProductSizeBatchResponse(
+            success=True,
+            data=batch_result
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -89,10 +268,31 @@ async def add_size_to_product(
         product_service = ProductService(db)
         product_item = await product_service.add_size_to_product(product_id, size_data)
 
-        return ProductResponse(
+        return ModelResponse(ProductResponse(
             success=True,
             data=product_item
+        ), status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
         )
+
+
+@router.delete("/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
+async def delete_product(
+    product_id: int,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        product_service = ProductService(db)
+        product_item = await product_service.delete_product(product_id)
+
+        return ModelResponse(ProductResponse(
+            success=True,
+            data=product_item
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -111,10 +311,10 @@ async def delete_size_from_product(
         product_service = ProductService(db)
         product_item = await product_service.delete_size_from_product(product_id, size_id)
 
-        return ProductResponse(
+        return ModelResponse(ProductResponse(
             success=True,
             data=product_item
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -134,10 +334,10 @@ async def update_product_size(
         product_service = ProductService(db)
         product_item = await product_service.update_product_size(product_id, size_id, size_data)
 
-        return ProductResponse(
+        return ModelResponse(ProductResponse(
             success=True,
             data=product_item
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
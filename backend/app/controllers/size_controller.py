@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from app.core.database.postgresql import get_async_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.size_service import SizeService
 from app.schemas.size import SizeCreate, SizeUpdate, SizeResponse
+from app.utils.response import ModelResponse
+from app.utils.etag import build_etag, etag_matches, etag_headers
 from app.utils.error_handler import get_db_error_message, get_exception_status_code
 
 router = APIRouter(prefix="/sizes", tags=["sizes"])
@@ -11,16 +13,27 @@ model_name = "Size"
 
 @router.get("/", response_model=SizeResponse, status_code=status.HTTP_200_OK)
 async def get_sizes(
+    request: Request,
     db: AsyncSession = Depends(get_async_session)
 ):
     try:
         size_service = SizeService(db)
+
+        etag = None
+        try:
+            etag = build_etag("sizes", await size_service.get_generation())
+        except Exception:
+            pass
+
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
         sizes = await size_service.get_sizes()
 
-        return SizeResponse(
+        return ModelResponse(SizeResponse(
             success=True,
             data=sizes
-        )
+        ), status_code=status.HTTP_200_OK, headers=etag_headers(etag) if etag else None)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -37,10 +50,10 @@ async def create_size(
         size_service = SizeService(db)
         size = await size_service.create_size(size_data)
 
-        return SizeResponse(
+        return ModelResponse(SizeResponse(
             success=True,
             data=size
-        )
+        ), status_code=status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -58,10 +71,10 @@ async def update_size(
         size_service = SizeService(db)
         size = await size_service.update_size(size_id, size_data)
 
-        return SizeResponse(
+        return ModelResponse(SizeResponse(
             success=True,
             data=size
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -78,10 +91,10 @@ async def delete_size(
         size_service = SizeService(db)
         size = await size_service.delete_size(size_id)
 
-        return SizeResponse(
+        return ModelResponse(SizeResponse(
             success=True,
             data=size
-        )
+        ), status_code=status.HTTP_200_OK)
     except Exception as e:
         raise HTTPException(
             status_code=get_exception_status_code(e),
@@ -0,0 +1,143 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.core.database.postgresql import get_async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.stock_reservation_service import StockReservationService
+from app.services.stock_counter_service import StockCounterService
+from app.schemas.stock_reservation import StockChange, StockReservationCreate, StockReservationResponse, StockCounterResponse
+from app.core.security.dependencies import get_current_user
+from app.schemas.user import UserResponse
+from app.utils.response import ModelResponse
+from app.utils.error_handler import get_db_error_message, get_exception_status_code
+from uuid import UUID
+
+router = APIRouter(prefix="/stock", tags=["stock"])
+
+model_name = "Stock reservation"
+
+
+@router.post("/decrement", response_model=StockReservationResponse, status_code=status.HTTP_200_OK)
+async def decrement_stock(
+    stock_change: StockChange,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_reservation_service = StockReservationService(db)
+        stock_item = await stock_reservation_service.decrement_stock(stock_change)
+
+        return ModelResponse(StockReservationResponse(
+            success=True,
+            data=stock_item
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.post("/reservations", response_model=StockReservationResponse, status_code=status.HTTP_201_CREATED)
+async def reserve_stock(
+    reservation_data: StockReservationCreate,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_reservation_service = StockReservationService(db)
+        reservation_item = await stock_reservation_service.reserve_stock(reservation_data)
+
+        return ModelResponse(StockReservationResponse(
+            success=True,
+            data=reservation_item
+        ), status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.post("/reservations/{reservation_id}/commit", response_model=StockReservationResponse, status_code=status.HTTP_200_OK)
+async def commit_reservation(
+    reservation_id: UUID,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_reservation_service = StockReservationService(db)
+        reservation_item = await stock_reservation_service.commit_reservation(reservation_id)
+
+        return ModelResponse(StockReservationResponse(
+            success=True,
+            data=reservation_item
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.delete("/reservations/{reservation_id}", response_model=StockReservationResponse, status_code=status.HTTP_200_OK)
+async def release_reservation(
+    reservation_id: UUID,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_reservation_service = StockReservationService(db)
+        reservation_item = await stock_reservation_service.release_reservation(reservation_id)
+
+        return ModelResponse(StockReservationResponse(
+            success=True,
+            data=reservation_item
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.put("/hot/{product_id}/{size_id}", response_model=StockCounterResponse, status_code=status.HTTP_200_OK)
+async def flag_hot_stock(
+    product_id: int,
+    size_id: int,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_counter_service = StockCounterService(db)
+        stock_counter_item = await stock_counter_service.flag_hot(product_id, size_id)
+
+        return ModelResponse(StockCounterResponse(
+            success=True,
+            data=stock_counter_item
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
+
+
+@router.delete("/hot/{product_id}/{size_id}", response_model=StockCounterResponse, status_code=status.HTTP_200_OK)
+async def unflag_hot_stock(
+    product_id: int,
+    size_id: int,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    try:
+        stock_counter_service = StockCounterService(db)
+        stock_counter_item = await stock_counter_service.unflag_hot(product_id, size_id)
+
+        return ModelResponse(StockCounterResponse(
+            success=True,
+            data=stock_counter_item
+        ), status_code=status.HTTP_200_OK)
+    except Exception as e:
+        raise HTTPException(
+            status_code=get_exception_status_code(e),
+            detail=get_db_error_message(e, model_name)
+        )
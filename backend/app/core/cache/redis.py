@@ -2,6 +2,7 @@ import redis.asyncio as redis
 from app.core.config import settings
 
 redis_client = None
+raw_redis_client = None
 
 async def get_redis():
     global redis_client
@@ -13,3 +14,9 @@ async def get_redis():
         )
     return redis_client
 
+async def get_raw_redis():
+    global raw_redis_client
+    if raw_redis_client is None:
+        raw_redis_client = await redis.from_url(settings.redis_url)
+    return raw_redis_client
+
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from app.core.cache.local import LocalCache
+from app.core.cache.redis import get_redis, get_raw_redis
+from app.core.constants import (
+    REDIS_KEYS,
+    CACHE_LOCAL_MAX_ENTRIES,
+    CACHE_LOCAL_MAX_BYTES,
+    CACHE_LOCAL_TTL,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_LOCK_POLL_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class TieredCache:
+    def __init__(self, local: LocalCache, channel: str):
+        self.local = local
+        self.channel = channel
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.computes = 0
+        self.coalesced = 0
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self._epochs: Dict[str, int] = {}
+        self._clears = 0
+
+    def _epoch(self, key: str) -> tuple:
+        return self._clears, self._epochs.get(key, 0)
+
+    def _evict(self, key: str):
+        self._epochs[key] = self._epochs.get(key, 0) + 1
+        self.local.delete(key)
+
+    def _clear(self):
+        self._clears += 1
+        self._epochs.clear()
+        self.local.clear()
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        epoch = self._epoch(key)
+        redis = await get_redis()
+        raw = await redis.get(key)
+        if raw is None:
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        value = json.loads(raw)
+        if self._epoch(key) == epoch:
+            self.local.set(key, value, len(raw), CACHE_LOCAL_TTL)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int):
+        raw = json.dumps(value)
+
+        redis = await get_redis()
+        await redis.setex(key, ttl, raw)
+        self.local.set(key, value, len(raw), min(ttl, CACHE_LOCAL_TTL))
+
+    async def _get_entry(self, key: str) -> Optional[Tuple[float, bytes]]:
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry
+
+        epoch = self._epoch(key)
+        redis = await get_raw_redis()
+        fresh_until, value = await redis.hmget(key, "fresh_until", "value")
+        if value is None:
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        entry = (float(fresh_until), value)
+        if self._epoch(key) == epoch:
+            self.local.set(key, entry, len(value), CACHE_LOCAL_TTL)
+        return entry
+
+    async def _set_entry(self, key: str, value: bytes, fresh_until: float, ttl: int):
+        redis = await get_raw_redis()
+        async with redis.pipeline(transaction=True) as pipeline:
+            pipeline.hset(key, mapping={"fresh_until": repr(fresh_until), "value": value})
+            pipeline.expire(key, ttl)
+            await pipeline.execute()
+        self.local.set(key, (fresh_until, value), len(value), min(ttl, CACHE_LOCAL_TTL))
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Union[str, bytes]]], soft_ttl: int, hard_ttl: int) -> bytes:
+        try:
+            entry = await self._get_entry(key)
+        except Exception:
+            entry = None
+
+        if entry is not None:
+            fresh_until, value = entry
+            if fresh_until > time.time():
+                self.fresh_hits += 1
+            else:
+                self.stale_hits += 1
+                self._refresh_in_background(key, compute, soft_ttl, hard_ttl)
+            return value
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = self._start_compute(self._in_flight, key, compute, soft_ttl, hard_ttl, wait=True)
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(in_flight)
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Awaitable[Union[str, bytes]]], soft_ttl: int, hard_ttl: int):
+        if key in self._in_flight or key in self._refreshing:
+            return
+
+        self.refreshes += 1
+        refresh = self._start_compute(self._refreshing, key, compute, soft_ttl, hard_ttl, wait=False)
+        refresh.add_done_callback(self._log_refresh_failure)
+
+    def _start_compute(
+        self,
+        registry: Dict[str, asyncio.Future],
+        key: str,
+        compute: Callable[[], Awaitable[Union[str, bytes]]],
+        soft_ttl: int,
+        hard_ttl: int,
+        wait: bool
+    ) -> asyncio.Future:
+        in_flight = asyncio.ensure_future(self._compute(key, compute, soft_ttl, hard_ttl, wait))
+        registry[key] = in_flight
+        in_flight.add_done_callback(lambda _: registry.pop(key, None))
+        return in_flight
+
+    def _log_refresh_failure(self, refresh: asyncio.Future):
+        if not refresh.cancelled() and refresh.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {refresh.exception()}")
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Union[str, bytes]]], soft_ttl: int, hard_ttl: int, wait: bool) -> Optional[bytes]:
+        lock_key = REDIS_KEYS["cache"]["lock"].format(key=key)
+        lock_token = None
+
+        try:
+            redis = await get_redis()
+            token = uuid.uuid4().hex
+            if await redis.set(lock_key, token, nx=True, ex=CACHE_LOCK_TIMEOUT):
+                lock_token = token
+            elif not wait:
+                return None
+            else:
+                entry = await self._wait_for_entry(key, lock_key)
+                if entry is not None:
+                    self.coalesced += 1
+                    return entry[1]
+        except Exception:
+            pass
+
+        try:
+            self.computes += 1
+            value = await compute()
+            if isinstance(value, str):
+                value = value.encode()
+
+            try:
+                await self._set_entry(key, value, time.time() + soft_ttl, hard_ttl)
+            except Exception:
+                pass
+
+            return value
+        finally:
+            if lock_token is not None:
+                try:
+                    await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+                except Exception:
+                    pass
+
+    async def _wait_for_entry(self, key: str, lock_key: str) -> Optional[Tuple[float, bytes]]:
+        redis = await get_redis()
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL_INTERVAL)
+            entry = await self._get_entry(key)
+            if entry is not None:
+                return entry
+            if not await redis.exists(lock_key):
+                return await self._get_entry(key)
+
+        return None
+
+    async def incr(self, key: str) -> int:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipeline:
+            pipeline.set(key, int(time.time() * 1000), nx=True)
+            pipeline.incr(key)
+            _, value = await pipeline.execute()
+        await self.invalidate_local(key)
+        return value
+
+    async def get_generation(self, key: str) -> int:
+        generation = await self.get(key)
+        if generation is None:
+            generation = await self.incr(key)
+        return generation
+
+    async def invalidate_local(self, *keys: str):
+        for key in keys:
+            self._evict(key)
+
+        redis = await get_redis()
+        await redis.publish(self.channel, json.dumps({"keys": list(keys)}))
+
+    async def listen(self):
+        while True:
+            pubsub = None
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                self._clear()
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    for key in json.loads(message["data"]).get("keys", []):
+                        self._evict(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed, reconnecting: {e}")
+                self._clear()
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    await pubsub.reset()
+
+    def stats(self) -> dict:
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+            },
+            "computes": self.computes,
+            "coalesced": self.coalesced,
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+        }
+
+
+cache = TieredCache(
+    LocalCache(CACHE_LOCAL_MAX_ENTRIES, CACHE_LOCAL_MAX_BYTES),
+    REDIS_KEYS["cache"]["invalidation"]
+)
@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     user_password: str
     user_email: str
     user_is_admin: bool = True
+    search_index_enabled: bool = False
+    search_cache_soft_ttl: int = 60
+    search_cache_hard_ttl: int = 300
+    hot_stock_enabled: bool = False
     postgres_db: Optional[str] = None
     postgres_user: Optional[str] = None
     postgres_password: Optional[str] = None
@@ -1,5 +1,57 @@
 REDIS_KEYS = {
     "product": {
-        "search": "product:search:{query}"
+        "search": "product:search:response:{generation}:{query}",
+        "generation": "product:generation",
+        "changes": "product:changes"
+    },
+    "category": {
+        "generation": "category:generation"
+    },
+    "size": {
+        "generation": "size:generation"
+    },
+    "cache": {
+        "invalidation": "cache:invalidate",
+        "lock": "cache:lock:{key}"
+    },
+    "stock": {
+        "hot": "stock:hot",
+        "counter": "stock:counter:{sku}",
+        "pending": "stock:pending",
+        "flushing": "stock:flushing",
+        "versions": "stock:versions"
     }
 }
+
+PRODUCT_PAGE_SIZE = 50
+PRODUCT_MAX_PAGE_SIZE = 500
+PRODUCT_STREAM_BATCH_SIZE = 500
+PRODUCT_SEARCH_LIMIT = 100
+PRODUCT_EXPORT_BATCH_SIZE = 1000
+PRODUCT_IMPORT_CHUNK_SIZE = 5000
+PRODUCT_IMPORT_MAX_ERRORS = 1000
+PRODUCT_SIZE_BATCH_MAX_ITEMS = 5000
+PRODUCT_CHANGES_QUEUE_SIZE = 1000
+PRODUCT_CHANGES_HEARTBEAT_INTERVAL = 15
+STOCK_LIVE_MAX_PRODUCTS = 500
+
+STOCK_RESERVATION_SWEEP_INTERVAL = 5
+STOCK_RESERVATION_SWEEP_BATCH_SIZE = 1000
+STOCK_COUNTER_FLUSH_INTERVAL = 1
+STOCK_COUNTER_FLUSH_RETENTION_DAYS = 1
+
+IMAGE_VARIANT_WIDTHS = {
+    "thumb": 320,
+    "medium": 960
+}
+IMAGE_VARIANT_FORMATS = ["avif", "webp"]
+IMAGE_PROCESS_WORKERS = 2
+IMAGE_GC_INTERVAL = 3600
+IMAGE_GC_GRACE_PERIOD = 3600
+IMAGE_GC_BATCH_SIZE = 1000
+
+CACHE_LOCAL_MAX_ENTRIES = 10000
+CACHE_LOCAL_MAX_BYTES = 32 * 1024 * 1024
+CACHE_LOCAL_TTL = 30
+CACHE_LOCK_TIMEOUT = 5
+CACHE_LOCK_POLL_INTERVAL = 0.05
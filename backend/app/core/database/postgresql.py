@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
@@ -27,6 +28,7 @@ async def create_tables():
     for attempt in range(max_retries):
         try:
             async with engine.begin() as conn:
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
                 await conn.run_sync(Base.metadata.create_all)
             logger.info("Database tables created successfully")
             return
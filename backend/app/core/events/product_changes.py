@@ -0,0 +1,70 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Set
+from app.core.cache.redis import get_redis
+from app.core.constants import REDIS_KEYS, PRODUCT_CHANGES_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = json.dumps({"type": "resync"})
+
+
+class ProductChangeFeed:
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    async def publish(self, *payloads: str):
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipeline:
+            for payload in payloads:
+                pipeline.publish(self.channel, payload)
+            await pipeline.execute()
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue = asyncio.Queue(maxsize=PRODUCT_CHANGES_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def _dispatch(self, payload: str):
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+    async def listen(self):
+        while True:
+            pubsub = None
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(self.channel)
+
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        self._dispatch(RESYNC_EVENT)
+                    elif message["type"] == "message":
+                        self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Product change listener failed, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    await pubsub.reset()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+product_change_feed = ProductChangeFeed(REDIS_KEYS["product"]["changes"])
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, Set, Tuple
+from app.core.events.product_changes import product_change_feed
+from app.core.constants import STOCK_LIVE_MAX_PRODUCTS
+
+logger = logging.getLogger(__name__)
+
+
+class StockSubscriber:
+    def __init__(self):
+        self.product_ids: Set[int] = set()
+        self.pending: Dict[Tuple[int, int], dict] = {}
+        self.resync = False
+        self.ready = asyncio.Event()
+
+    def push(self, event: dict):
+        self.pending[(event["product_id"], event["size_id"])] = event
+        self.ready.set()
+
+    def request_resync(self):
+        self.resync = True
+        self.pending.clear()
+        self.ready.set()
+
+    async def next_message(self) -> dict:
+        await self.ready.wait()
+        self.ready.clear()
+
+        if self.resync:
+            self.resync = False
+            if self.pending:
+                self.ready.set()
+            return {"type": "resync"}
+
+        updates = list(self.pending.values())
+        self.pending.clear()
+        return {"type": "stock", "updates": updates}
+
+
+class StockChannel:
+    def __init__(self):
+        self._subscribers: Dict[int, Set[StockSubscriber]] = {}
+        self._connections: Set[StockSubscriber] = set()
+
+    def connect(self) -> StockSubscriber:
+        subscriber = StockSubscriber()
+        self._connections.add(subscriber)
+        return subscriber
+
+    def disconnect(self, subscriber: StockSubscriber):
+        self.unsubscribe(subscriber, list(subscriber.product_ids))
+        self._connections.discard(subscriber)
+
+    def subscribe(self, subscriber: StockSubscriber, product_ids: Iterable[int]):
+        product_ids = set(product_ids)
+        if len(subscriber.product_ids | product_ids) > STOCK_LIVE_MAX_PRODUCTS:
+            raise ValueError(f"Cannot subscribe to more than {STOCK_LIVE_MAX_PRODUCTS} products")
+
+        for product_id in product_ids:
+            subscriber.product_ids.add(product_id)
+            self._subscribers.setdefault(product_id, set()).add(subscriber)
+
+    def unsubscribe(self, subscriber: StockSubscriber, product_ids: Iterable[int]):
+        for product_id in product_ids:
+            subscriber.product_ids.discard(product_id)
+            subscribers = self._subscribers.get(product_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[product_id]
+
+    def _dispatch(self, event: dict):
+        if event.get("type") == "resync":
+            for subscriber in self._connections:
+                subscriber.request_resync()
+            return
+
+        if event.get("size_id") is None:
+            return
+
+        for subscriber in self._subscribers.get(event["product_id"], ()):
+            subscriber.push(event)
+
+    async def listen(self):
+        async with product_change_feed.subscribe() as queue:
+            while True:
+                payload = await queue.get()
+                try:
+                    self._dispatch(json.loads(payload))
+                except Exception as e:
+                    logger.warning(f"Dropping malformed product change event: {e}")
+
+
+stock_channel = StockChannel()
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+from app.core.database.postgresql import async_session_maker
+from app.services.image_blob_service import ImageBlobService
+from app.core.constants import IMAGE_GC_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+async def collect_image_garbage():
+    while True:
+        await asyncio.sleep(IMAGE_GC_INTERVAL)
+        try:
+            async with async_session_maker() as db:
+                removed = await ImageBlobService(db).collect_garbage()
+            if removed:
+                logger.info(f"Removed {removed} unreferenced product images")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to collect unreferenced product images: {e}")
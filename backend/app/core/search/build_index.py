@@ -0,0 +1,23 @@
+import logging
+from app.core.database.postgresql import async_session_maker
+from app.core.search.inverted_index import product_search_index
+from app.services.product_service import ProductService
+from app.schemas.product import ProductFilter
+
+logger = logging.getLogger(__name__)
+
+
+async def build_product_search_index():
+    async with async_session_maker() as db:
+        try:
+            product_service = ProductService(db)
+            product_search_index.start_build()
+
+            async for product_item in product_service.stream_products(ProductFilter()):
+                product_search_index.load(product_item)
+
+            product_search_index.finish_build()
+            logger.info(f"Product search index built with {len(product_search_index)} products")
+        except Exception as e:
+            product_search_index.clear()
+            logger.error(f"Failed to build product search index: {e}")
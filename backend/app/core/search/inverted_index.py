@@ -0,0 +1,154 @@
+import re
+from array import array
+from bisect import bisect_left, insort
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Set
+from app.schemas.product import ProductItem
+from app.core.constants import PRODUCT_SEARCH_LIMIT
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class ProductSearchIndex:
+    def __init__(self):
+        self.ready = False
+        self.building = False
+        self._pending: List[Callable[[], None]] = []
+        self._documents: Dict[int, ProductItem] = {}
+        self._doc_terms: Dict[int, Set[str]] = {}
+        self._name_terms: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, array] = {}
+        self._terms: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def clear(self):
+        self.ready = False
+        self.building = False
+        self._pending.clear()
+        self._documents.clear()
+        self._doc_terms.clear()
+        self._name_terms.clear()
+        self._postings.clear()
+        self._terms.clear()
+
+    def start_build(self):
+        self.clear()
+        self.building = True
+
+    def load(self, product_item: ProductItem):
+        self._upsert(product_item)
+
+    def finish_build(self):
+        for write in self._pending:
+            write()
+        self._pending.clear()
+        self.building = False
+        self._terms = sorted(self._postings)
+        self.ready = True
+
+    def _apply(self, write: Callable[[], None]):
+        if self.building:
+            self._pending.append(write)
+        elif self.ready:
+            write()
+
+    def upsert(self, product_item: ProductItem):
+        self._apply(partial(self._upsert, product_item))
+
+    def remove(self, product_id: int):
+        self._apply(partial(self._remove, product_id))
+
+    def rename_size(self, size_id: int, size_name: str):
+        self._apply(partial(self._rename_size, size_id, size_name))
+
+    def _upsert(self, product_item: ProductItem):
+        name_terms = set(tokenize(product_item.name))
+        terms = name_terms | set(tokenize(product_item.description))
+        previous_terms = self._doc_terms.get(product_item.id, set())
+
+        for term in previous_terms - terms:
+            self._remove_posting(term, product_item.id)
+        for term in terms - previous_terms:
+            self._add_posting(term, product_item.id)
+
+        self._documents[product_item.id] = product_item
+        self._doc_terms[product_item.id] = terms
+        self._name_terms[product_item.id] = name_terms
+
+    def _remove(self, product_id: int):
+        for term in self._doc_terms.pop(product_id, set()):
+            self._remove_posting(term, product_id)
+        self._documents.pop(product_id, None)
+        self._name_terms.pop(product_id, None)
+
+    def _rename_size(self, size_id: int, size_name: str):
+        for product_id, product_item in self._documents.items():
+            if any(size.size_id == size_id for size in product_item.sizes):
+                self._documents[product_id] = product_item.model_copy(update={"sizes": [
+                    size.model_copy(update={"size_name": size_name}) if size.size_id == size_id else size
+                    for size in product_item.sizes
+                ]})
+
+    def search(self, query_text: str, limit: int = PRODUCT_SEARCH_LIMIT) -> List[ProductItem]:
+        query_terms = tokenize(query_text)
+        if not query_terms:
+            return []
+
+        matches = None
+        for query_term in query_terms:
+            term_matches = set(self._prefix_postings(query_term))
+            matches = term_matches if matches is None else matches & term_matches
+            if not matches:
+                return []
+
+        def rank(product_id: int):
+            name_terms = self._name_terms[product_id]
+            name_hits = sum(
+                1 for query_term in query_terms
+                if any(term.startswith(query_term) for term in name_terms)
+            )
+            return (-name_hits, product_id)
+
+        return [self._documents[product_id] for product_id in sorted(matches, key=rank)[:limit]]
+
+    def _prefix_postings(self, prefix: str) -> Iterable[int]:
+        position = bisect_left(self._terms, prefix)
+        while position < len(self._terms) and self._terms[position].startswith(prefix):
+            yield from self._postings[self._terms[position]]
+            position += 1
+
+    def _add_posting(self, term: str, product_id: int):
+        postings = self._postings.get(term)
+        if postings is None:
+            postings = self._postings[term] = array("I")
+            if self.ready:
+                insort(self._terms, term)
+
+        position = bisect_left(postings, product_id)
+        if position == len(postings) or postings[position] != product_id:
+            postings.insert(position, product_id)
+
+    def _remove_posting(self, term: str, product_id: int):
+        postings = self._postings.get(term)
+        if postings is None:
+            return
+
+        position = bisect_left(postings, product_id)
+        if position < len(postings) and postings[position] == product_id:
+            del postings[position]
+
+        if not postings:
+            del self._postings[term]
+            if self.ready:
+                del self._terms[bisect_left(self._terms, term)]
+
+
+product_search_index = ProductSearchIndex()
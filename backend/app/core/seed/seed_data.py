@@ -4,7 +4,7 @@ from app.services.size_service import SizeService
 from app.services.product_service import ProductService
 from app.schemas.category import CategoryCreate
 from app.schemas.size import SizeCreate, SizeUpdate
-from app.schemas.product import ProductCreate, ProductSizeAdd
+from app.schemas.product import ProductCreate, ProductSizeAdd, ProductFilter
 
 
 async def seed_categories():
@@ -73,7 +73,7 @@ async def seed_products():
             category_service = CategoryService(db)
             size_service = SizeService(db)
 
-            existing_products = await product_service.get_products()
+            existing_products, _, _ = await product_service.get_products(ProductFilter(), limit=1)
             if len(existing_products) > 0:
                 return
 
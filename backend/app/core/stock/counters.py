@@ -0,0 +1,205 @@
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.core.cache.redis import get_redis
+from app.core.constants import REDIS_KEYS
+from app.utils.exception import InsufficientStockError
+
+NOT_HOT = -2
+INSUFFICIENT_STOCK = -1
+
+DECREMENT_SCRIPT = """
+if redis.call("sismember", KEYS[1], ARGV[1]) == 0 then
+    return -2
+end
+local quantity = tonumber(ARGV[2])
+if tonumber(redis.call("get", KEYS[2]) or "0") < quantity then
+    return -1
+end
+redis.call("hincrby", KEYS[3], ARGV[1], -quantity)
+return redis.call("decrby", KEYS[2], quantity)
+"""
+
+INCREMENT_SCRIPT = """
+if redis.call("sismember", KEYS[1], ARGV[1]) == 0 then
+    return -2
+end
+redis.call("hincrby", KEYS[3], ARGV[1], ARGV[2])
+return redis.call("incrby", KEYS[2], ARGV[2])
+"""
+
+OVERWRITE_SCRIPT = """
+if redis.call("sismember", KEYS[1], ARGV[1]) == 0 then
+    return -2
+end
+redis.call("hdel", KEYS[3], ARGV[1])
+redis.call("hdel", KEYS[4], ARGV[1])
+redis.call("hincrby", KEYS[5], ARGV[1], 1)
+redis.call("set", KEYS[2], ARGV[2])
+return tonumber(ARGV[2])
+"""
+
+FLAG_SCRIPT = """
+if redis.call("sadd", KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call("set", KEYS[2], ARGV[2])
+return 1
+"""
+
+UNFLAG_SCRIPT = """
+if redis.call("srem", KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call("del", KEYS[2])
+local delta = tonumber(redis.call("hget", KEYS[3], ARGV[1]) or "0")
+redis.call("hdel", KEYS[3], ARGV[1])
+return delta
+"""
+
+BEGIN_FLUSH_SCRIPT = """
+if redis.call("exists", KEYS[2]) == 0 then
+    if redis.call("exists", KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call("rename", KEYS[1], KEYS[2])
+    for _, sku in ipairs(redis.call("hkeys", KEYS[2])) do
+        redis.call("hset", KEYS[2], "version:" .. sku, redis.call("hget", KEYS[3], sku) or "0")
+    end
+    redis.call("hset", KEYS[2], "batch", ARGV[1])
+end
+return redis.call("hgetall", KEYS[2])
+"""
+
+
+def _sku(product_id: int, size_id: int) -> str:
+    return f"{product_id}:{size_id}"
+
+
+class StockCounters:
+    def __init__(self):
+        self.hot_key = REDIS_KEYS["stock"]["hot"]
+        self.pending_key = REDIS_KEYS["stock"]["pending"]
+        self.flushing_key = REDIS_KEYS["stock"]["flushing"]
+        self.versions_key = REDIS_KEYS["stock"]["versions"]
+
+    def _counter_key(self, product_id: int, size_id: int) -> str:
+        return REDIS_KEYS["stock"]["counter"].format(sku=_sku(product_id, size_id))
+
+    async def _run(self, script: str, product_id: int, size_id: int, value: int) -> int:
+        redis = await get_redis()
+        return await redis.eval(
+            script,
+            3,
+            self.hot_key,
+            self._counter_key(product_id, size_id),
+            self.pending_key,
+            _sku(product_id, size_id),
+            value
+        )
+
+    async def decrement(self, product_id: int, size_id: int, quantity: int) -> Optional[int]:
+        stock = await self._run(DECREMENT_SCRIPT, product_id, size_id, quantity)
+        if stock == NOT_HOT:
+            return None
+        if stock == INSUFFICIENT_STOCK:
+            raise InsufficientStockError("Insufficient stock")
+        return stock
+
+    async def increment(self, product_id: int, size_id: int, quantity: int) -> Optional[int]:
+        stock = await self._run(INCREMENT_SCRIPT, product_id, size_id, quantity)
+        return None if stock == NOT_HOT else stock
+
+    async def overwrite(self, product_id: int, size_id: int, stock: int) -> Optional[int]:
+        return (await self.overwrite_many([(product_id, size_id, stock)]))[0]
+
+    async def overwrite_many(self, items: Iterable[Tuple[int, int, int]]) -> List[Optional[int]]:
+        items = list(items)
+        if not items:
+            return []
+
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipeline:
+            for product_id, size_id, stock in items:
+                pipeline.eval(
+                    OVERWRITE_SCRIPT,
+                    5,
+                    self.hot_key,
+                    self._counter_key(product_id, size_id),
+                    self.pending_key,
+                    self.flushing_key,
+                    self.versions_key,
+                    _sku(product_id, size_id),
+                    stock
+                )
+            results = await pipeline.execute()
+
+        return [None if stock == NOT_HOT else stock for stock in results]
+
+    async def flag(self, product_id: int, size_id: int, stock: int) -> bool:
+        redis = await get_redis()
+        flagged = await redis.eval(
+            FLAG_SCRIPT,
+            2,
+            self.hot_key,
+            self._counter_key(product_id, size_id),
+            _sku(product_id, size_id),
+            stock
+        )
+        return bool(flagged)
+
+    async def unflag(self, product_id: int, size_id: int) -> int:
+        return await self._run(UNFLAG_SCRIPT, product_id, size_id, 0)
+
+    async def get_versions(self, skus: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        skus = list(skus)
+        if not skus:
+            return {}
+
+        redis = await get_redis()
+        values = await redis.hmget(self.versions_key, [_sku(product_id, size_id) for product_id, size_id in skus])
+        return {sku: int(value or 0) for sku, value in zip(skus, values)}
+
+    async def get_stock(self, skus: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        skus = list(skus)
+        if not skus:
+            return {}
+
+        redis = await get_redis()
+        values = await redis.mget([self._counter_key(product_id, size_id) for product_id, size_id in skus])
+        return {sku: int(value) for sku, value in zip(skus, values) if value is not None}
+
+    async def begin_flush(self) -> Optional[Tuple[uuid.UUID, Dict[Tuple[int, int], int], Dict[Tuple[int, int], int]]]:
+        redis = await get_redis()
+        fields = await redis.eval(
+            BEGIN_FLUSH_SCRIPT,
+            3,
+            self.pending_key,
+            self.flushing_key,
+            self.versions_key,
+            uuid.uuid4().hex
+        )
+        if not fields:
+            return None
+
+        entries = dict(zip(fields[::2], fields[1::2]))
+        batch_id = uuid.UUID(entries.pop("batch"))
+
+        deltas = {}
+        versions = {}
+        for field, value in entries.items():
+            if field.startswith("version:"):
+                continue
+            product_id, size_id = field.split(":")
+            if int(value):
+                sku = (int(product_id), int(size_id))
+                deltas[sku] = int(value)
+                versions[sku] = int(entries.get(f"version:{field}", 0))
+
+        return batch_id, deltas, versions
+
+    async def end_flush(self):
+        redis = await get_redis()
+        await redis.delete(self.flushing_key)
+
+
+stock_counters = StockCounters()
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+from app.core.database.postgresql import async_session_maker
+from app.services.stock_counter_service import StockCounterService
+from app.core.constants import STOCK_COUNTER_FLUSH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_stock_counters():
+    while True:
+        try:
+            async with async_session_maker() as db:
+                product_ids = await StockCounterService(db).flush()
+            if product_ids:
+                logger.info(f"Flushed hot stock counters for {len(product_ids)} products")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to flush hot stock counters: {e}")
+        await asyncio.sleep(STOCK_COUNTER_FLUSH_INTERVAL)
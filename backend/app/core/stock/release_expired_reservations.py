@@ -0,0 +1,21 @@
+import asyncio
+import logging
+from app.core.database.postgresql import async_session_maker
+from app.services.stock_reservation_service import StockReservationService
+from app.core.constants import STOCK_RESERVATION_SWEEP_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+async def release_expired_reservations():
+    while True:
+        await asyncio.sleep(STOCK_RESERVATION_SWEEP_INTERVAL)
+        try:
+            async with async_session_maker() as db:
+                product_ids = await StockReservationService(db).release_expired_reservations()
+            if product_ids:
+                logger.info(f"Released expired stock reservations for {len(product_ids)} products")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to release expired stock reservations: {e}")
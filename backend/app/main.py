@@ -1,14 +1,24 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import HTTPException, RequestValidationError
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from app.core.database.postgresql import create_tables
 from app.core.security.create_admin_user import create_admin_user
 from app.core.seed.seed_data import seed_all_data
+from app.core.search.build_index import build_product_search_index
+from app.core.config import settings
+from app.core.cache.tiered import cache
+from app.core.events.product_changes import product_change_feed
+from app.core.events.stock_channel import stock_channel
+from app.core.stock.release_expired_reservations import release_expired_reservations
+from app.core.stock.flush_stock_counters import flush_stock_counters
+from app.core.images.collect_image_garbage import collect_image_garbage
 from app.utils.exception import http_exception_handler
+from app.utils.image_variants import shutdown_image_executor
 from contextlib import asynccontextmanager
-from app.controllers import auth_controller,user_controller,category_controller,product_controller,size_controller
+from app.controllers import auth_controller,user_controller,category_controller,product_controller,size_controller,cache_controller,stock_controller,image_controller
 from pathlib import Path
+import asyncio
 
 
 @asynccontextmanager
@@ -18,18 +28,33 @@ async def lifespan(app: FastAPI):
     await create_tables()
     await create_admin_user()
     await seed_all_data()
+    if settings.search_index_enabled:
+        await build_product_search_index()
+    cache_listener = asyncio.create_task(cache.listen())
+    product_change_listener = asyncio.create_task(product_change_feed.listen())
+    stock_channel_listener = asyncio.create_task(stock_channel.listen())
+    reservation_sweeper = asyncio.create_task(release_expired_reservations())
+    stock_flusher = asyncio.create_task(flush_stock_counters()) if settings.hot_stock_enabled else None
+    image_collector = asyncio.create_task(collect_image_garbage())
     yield
+    image_collector.cancel()
+    if stock_flusher:
+        stock_flusher.cancel()
+    reservation_sweeper.cancel()
+    stock_channel_listener.cancel()
+    product_change_listener.cancel()
+    cache_listener.cancel()
+    shutdown_image_executor()
 
 
 app = FastAPI(
     title="Simple Storage Api",
     description="Simple Storage Api",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
-
 app.add_exception_handler(HTTPException, http_exception_handler)
 
 app.add_middleware(
@@ -45,6 +70,9 @@ app.include_router(user_controller.router, prefix="/api/v1")
 app.include_router(category_controller.router, prefix="/api/v1")
 app.include_router(product_controller.router, prefix="/api/v1")
 app.include_router(size_controller.router, prefix="/api/v1")
+app.include_router(cache_controller.router, prefix="/api/v1")
+app.include_router(stock_controller.router, prefix="/api/v1")
+app.include_router(image_controller.router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,201 @@
+"""add product read models
+
+Revision ID: 20f0cdf8b8f8
+Revises: 38441108478e
+Create Date: 2026-10-18 15:02:19.774310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20f0cdf8b8f8'
+down_revision: Union[str, Sequence[str], None] = '38441108478e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_CHANGED = """
+CREATE OR REPLACE FUNCTION product_read_models_products_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_INSERTED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT DISTINCT product_id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT product_id FROM new_rows UNION SELECT product_id FROM old_rows
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_DELETED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT DISTINCT product_id FROM old_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT DISTINCT ps.product_id FROM product_sizes ps JOIN new_rows s ON s.id = ps.size_id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    "CREATE OR REPLACE TRIGGER product_read_models_products_inserted AFTER INSERT ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_products_changed()",
+    "CREATE OR REPLACE TRIGGER product_read_models_products_updated AFTER UPDATE ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_products_changed()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_inserted AFTER INSERT ON product_sizes "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_inserted()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_updated AFTER UPDATE ON product_sizes "
+    "REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_updated()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_deleted AFTER DELETE ON product_sizes "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_deleted()",
+    "CREATE OR REPLACE TRIGGER product_read_models_sizes_updated AFTER UPDATE ON sizes "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_sizes_updated()",
+]
+
+BACKFILL = (
+    "SELECT refresh_product_read_models(ARRAY("
+    "SELECT p.id FROM products p WHERE NOT EXISTS (SELECT 1 FROM product_read_models r WHERE r.id = p.id)"
+    "))"
+)
+
+PRODUCT_READ_MODEL_DDL = [
+    REFRESH_PRODUCT_READ_MODELS,
+    PRODUCTS_CHANGED,
+    PRODUCT_SIZES_INSERTED,
+    PRODUCT_SIZES_UPDATED,
+    PRODUCT_SIZES_DELETED,
+    SIZES_UPDATED,
+    *TRIGGERS,
+    BACKFILL,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('product_read_models',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('image', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('sizes', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    sa.Column('min_price', sa.Float(), nullable=True),
+    sa.Column('max_price', sa.Float(), nullable=True),
+    sa.Column('total_stock', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))", persisted=True), nullable=True),
+    sa.ForeignKeyConstraint(['id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_product_read_models_search_vector', 'product_read_models', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_product_read_models_name_trgm', 'product_read_models', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_product_read_models_description_trgm', 'product_read_models', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.create_index('ix_product_read_models_category_id_id', 'product_read_models', ['category_id', 'id'], unique=False)
+
+    for statement in PRODUCT_READ_MODEL_DDL:
+        op.execute(statement)
+
+    op.drop_index('ix_products_description_trgm', table_name='products')
+    op.drop_index('ix_products_name_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.drop_column('products', 'search_vector')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('products', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))", persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_products_name_trgm', 'products', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_products_description_trgm', 'products', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_sizes_updated ON sizes")
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_product_sizes_deleted ON product_sizes")
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_product_sizes_updated ON product_sizes")
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_product_sizes_inserted ON product_sizes")
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_products_updated ON products")
+    op.execute("DROP TRIGGER IF EXISTS product_read_models_products_inserted ON products")
+    op.execute("DROP FUNCTION IF EXISTS product_read_models_sizes_updated()")
+    op.execute("DROP FUNCTION IF EXISTS product_read_models_product_sizes_deleted()")
+    op.execute("DROP FUNCTION IF EXISTS product_read_models_product_sizes_updated()")
+    op.execute("DROP FUNCTION IF EXISTS product_read_models_product_sizes_inserted()")
+    op.execute("DROP FUNCTION IF EXISTS product_read_models_products_changed()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_product_read_models(integer[])")
+
+    op.drop_index('ix_product_read_models_category_id_id', table_name='product_read_models')
+    op.drop_index('ix_product_read_models_description_trgm', table_name='product_read_models')
+    op.drop_index('ix_product_read_models_name_trgm', table_name='product_read_models')
+    op.drop_index('ix_product_read_models_search_vector', table_name='product_read_models')
+    op.drop_table('product_read_models')
@@ -0,0 +1,30 @@
+"""add product filter indexes
+
+Revision ID: 38441108478e
+Revises: a24b75a68959
+Create Date: 2026-10-18 13:47:05.531902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '38441108478e'
+down_revision: Union[str, Sequence[str], None] = 'a24b75a68959'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_products_category_id_id', 'products', ['category_id', 'id'], unique=False)
+    op.create_index('ix_product_sizes_size_id_price', 'product_sizes', ['size_id', 'price'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_sizes_size_id_price', table_name='product_sizes')
+    op.drop_index('ix_products_category_id_id', table_name='products')
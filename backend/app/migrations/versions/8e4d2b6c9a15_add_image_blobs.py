@@ -0,0 +1,119 @@
+"""add image blobs
+
+Revision ID: 8e4d2b6c9a15
+Revises: 5c1e7a9b3f20
+Create Date: 2026-10-18 20:11:37.402918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4d2b6c9a15'
+down_revision: Union[str, Sequence[str], None] = '5c1e7a9b3f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ADJUST_IMAGE_BLOB_REFS = """
+CREATE OR REPLACE FUNCTION adjust_image_blob_refs(images varchar[], delta integer) RETURNS void AS $$
+BEGIN
+    INSERT INTO image_blobs (filename, ref_count)
+    SELECT DISTINCT image, 0 FROM unnest(images) AS image WHERE image IS NOT NULL
+    ON CONFLICT (filename) DO NOTHING;
+
+    UPDATE image_blobs b
+    SET ref_count = greatest(b.ref_count + c.change, 0)
+    FROM (
+        SELECT image AS filename, delta * count(*) AS change
+        FROM unnest(images) AS image
+        WHERE image IS NOT NULL
+        GROUP BY image
+    ) c
+    WHERE b.filename = c.filename;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_INSERTED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(SELECT image FROM new_rows), 1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_UPDATED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(
+        SELECT n.image FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE n.image IS DISTINCT FROM o.image
+    ), 1);
+    PERFORM adjust_image_blob_refs(ARRAY(
+        SELECT o.image FROM old_rows o JOIN new_rows n ON n.id = o.id WHERE n.image IS DISTINCT FROM o.image
+    ), -1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_DELETED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(SELECT image FROM old_rows), -1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    "CREATE OR REPLACE TRIGGER image_blobs_products_inserted AFTER INSERT ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_inserted()",
+    "CREATE OR REPLACE TRIGGER image_blobs_products_updated AFTER UPDATE ON products "
+    "REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_updated()",
+    "CREATE OR REPLACE TRIGGER image_blobs_products_deleted AFTER DELETE ON products "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_deleted()",
+]
+
+BACKFILL = (
+    "INSERT INTO image_blobs (filename, ref_count) "
+    "SELECT image, count(*) FROM products WHERE image IS NOT NULL GROUP BY image "
+    "ON CONFLICT (filename) DO UPDATE SET ref_count = EXCLUDED.ref_count"
+)
+
+IMAGE_BLOB_DDL = [
+    ADJUST_IMAGE_BLOB_REFS,
+    PRODUCTS_INSERTED,
+    PRODUCTS_UPDATED,
+    PRODUCTS_DELETED,
+    *TRIGGERS,
+    BACKFILL,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('image_blobs',
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('filename')
+    )
+
+    for statement in IMAGE_BLOB_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS image_blobs_products_deleted ON products")
+    op.execute("DROP TRIGGER IF EXISTS image_blobs_products_updated ON products")
+    op.execute("DROP TRIGGER IF EXISTS image_blobs_products_inserted ON products")
+    op.execute("DROP FUNCTION IF EXISTS image_blobs_products_deleted()")
+    op.execute("DROP FUNCTION IF EXISTS image_blobs_products_updated()")
+    op.execute("DROP FUNCTION IF EXISTS image_blobs_products_inserted()")
+    op.execute("DROP FUNCTION IF EXISTS adjust_image_blob_refs(varchar[], integer)")
+    op.drop_table('image_blobs')
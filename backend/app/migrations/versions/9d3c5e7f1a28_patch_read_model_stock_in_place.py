@@ -0,0 +1,161 @@
+"""patch read model stock in place
+
+Revision ID: 9d3c5e7f1a28
+Revises: f2b8d4a61e37
+Create Date: 2026-10-19 11:32:40.218553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3c5e7f1a28'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4a61e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOCKED_REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    PERFORM 1 FROM products WHERE id = ANY(product_ids) ORDER BY id FOR NO KEY UPDATE;
+
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT product_id FROM new_rows UNION SELECT product_id FROM old_rows
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ROW_LOCKED_REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    PERFORM 1 FROM product_read_models WHERE id = ANY(product_ids) ORDER BY id FOR NO KEY UPDATE;
+
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PATCHING_PRODUCT_SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM 1 FROM product_read_models
+    WHERE id IN (SELECT product_id FROM new_rows UNION SELECT product_id FROM old_rows)
+    ORDER BY id FOR NO KEY UPDATE;
+
+    UPDATE product_read_models r SET
+        sizes = (
+            SELECT coalesce(jsonb_agg(
+                CASE WHEN c.stocks ? (e->>'size_id') THEN jsonb_set(e, '{stock}', c.stocks -> (e->>'size_id')) ELSE e END
+                ORDER BY position
+            ), '[]'::jsonb)
+            FROM jsonb_array_elements(r.sizes) WITH ORDINALITY AS elements(e, position)
+        ),
+        total_stock = r.total_stock + c.delta
+    FROM (
+        SELECT n.product_id, jsonb_object_agg(n.size_id::text, n.stock) AS stocks, sum(n.stock - o.stock) AS delta
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id = o.product_id
+        AND n.size_id = o.size_id
+        AND n.price IS NOT DISTINCT FROM o.price
+        AND n.stock IS DISTINCT FROM o.stock
+        GROUP BY n.product_id
+    ) c
+    WHERE r.id = c.product_id;
+
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT n.product_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id <> o.product_id OR n.size_id <> o.size_id OR n.price IS DISTINCT FROM o.price
+        UNION
+        SELECT o.product_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id <> o.product_id OR n.size_id <> o.size_id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(ROW_LOCKED_REFRESH_PRODUCT_READ_MODELS)
+    op.execute(PATCHING_PRODUCT_SIZES_UPDATED)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(PRODUCT_SIZES_UPDATED)
+    op.execute(LOCKED_REFRESH_PRODUCT_READ_MODELS)
@@ -0,0 +1,107 @@
+"""lock products while refreshing read models
+
+Revision ID: c7a3e51f9d42
+Revises: 8e4d2b6c9a15
+Create Date: 2026-10-19 10:14:52.381604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a3e51f9d42'
+down_revision: Union[str, Sequence[str], None] = '8e4d2b6c9a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+LOCKED_REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    PERFORM 1 FROM products WHERE id = ANY(product_ids) ORDER BY id FOR NO KEY UPDATE;
+
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(LOCKED_REFRESH_PRODUCT_READ_MODELS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(REFRESH_PRODUCT_READ_MODELS)
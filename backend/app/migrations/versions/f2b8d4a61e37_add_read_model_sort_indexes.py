@@ -0,0 +1,32 @@
+"""add read model sort indexes
+
+Revision ID: f2b8d4a61e37
+Revises: c7a3e51f9d42
+Create Date: 2026-10-19 10:48:05.617290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4a61e37'
+down_revision: Union[str, Sequence[str], None] = 'c7a3e51f9d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_product_read_models_name_id', 'product_read_models', ['name', 'id'], unique=False)
+    op.create_index('ix_product_read_models_min_price_id', 'product_read_models', [sa.text('coalesce(min_price, 0.0)'), 'id'], unique=False)
+    op.create_index('ix_product_sizes_price', 'product_sizes', ['price'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_sizes_price', table_name='product_sizes')
+    op.drop_index('ix_product_read_models_min_price_id', table_name='product_read_models')
+    op.drop_index('ix_product_read_models_name_id', table_name='product_read_models')
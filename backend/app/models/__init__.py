@@ -3,5 +3,9 @@ from app.models.size import Size
 from app.models.product import Product
 from app.models.product_size import ProductSize
 from app.models.user import User
+from app.models.product_read_model import ProductReadModel
+from app.models.stock_reservation import StockReservation
+from app.models.stock_counter_flush import StockCounterFlush
+from app.models.image_blob import ImageBlob
 
-__all__ = ["Category", "Size", "Product", "ProductSize", "User"]
\ No newline at end of file
+__all__ = ["Category", "Size", "Product", "ProductSize", "User", "ProductReadModel", "StockReservation", "StockCounterFlush", "ImageBlob"]
\ No newline at end of file
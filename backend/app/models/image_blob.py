@@ -0,0 +1,89 @@
+from app.core.database.postgresql import Base
+from sqlalchemy import Column, Integer, String, DDL, event, text
+
+ADJUST_IMAGE_BLOB_REFS = """
+CREATE OR REPLACE FUNCTION adjust_image_blob_refs(images varchar[], delta integer) RETURNS void AS $$
+BEGIN
+    INSERT INTO image_blobs (filename, ref_count)
+    SELECT DISTINCT image, 0 FROM unnest(images) AS image WHERE image IS NOT NULL
+    ON CONFLICT (filename) DO NOTHING;
+
+    UPDATE image_blobs b
+    SET ref_count = greatest(b.ref_count + c.change, 0)
+    FROM (
+        SELECT image AS filename, delta * count(*) AS change
+        FROM unnest(images) AS image
+        WHERE image IS NOT NULL
+        GROUP BY image
+    ) c
+    WHERE b.filename = c.filename;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_INSERTED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(SELECT image FROM new_rows), 1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_UPDATED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(
+        SELECT n.image FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE n.image IS DISTINCT FROM o.image
+    ), 1);
+    PERFORM adjust_image_blob_refs(ARRAY(
+        SELECT o.image FROM old_rows o JOIN new_rows n ON n.id = o.id WHERE n.image IS DISTINCT FROM o.image
+    ), -1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_DELETED = """
+CREATE OR REPLACE FUNCTION image_blobs_products_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM adjust_image_blob_refs(ARRAY(SELECT image FROM old_rows), -1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    "CREATE OR REPLACE TRIGGER image_blobs_products_inserted AFTER INSERT ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_inserted()",
+    "CREATE OR REPLACE TRIGGER image_blobs_products_updated AFTER UPDATE ON products "
+    "REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_updated()",
+    "CREATE OR REPLACE TRIGGER image_blobs_products_deleted AFTER DELETE ON products "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION image_blobs_products_deleted()",
+]
+
+BACKFILL_MISSING = (
+    "INSERT INTO image_blobs (filename, ref_count) "
+    "SELECT image, count(*) FROM products WHERE image IS NOT NULL GROUP BY image "
+    "ON CONFLICT (filename) DO NOTHING"
+)
+
+IMAGE_BLOB_DDL = [
+    ADJUST_IMAGE_BLOB_REFS,
+    PRODUCTS_INSERTED,
+    PRODUCTS_UPDATED,
+    PRODUCTS_DELETED,
+    *TRIGGERS,
+    BACKFILL_MISSING,
+]
+
+
+class ImageBlob(Base):
+    __tablename__ = "image_blobs"
+
+    filename = Column(String, primary_key=True)
+    ref_count = Column(Integer, nullable=False, server_default=text("0"))
+
+
+for statement in IMAGE_BLOB_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -1,5 +1,5 @@
 from app.core.database.postgresql import Base
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -11,4 +11,8 @@ class Product(Base):
     image = Column(String)
     description = Column(String)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
-    product_sizes = relationship("ProductSize", back_populates="product", lazy="selectin")
\ No newline at end of file
+    product_sizes = relationship("ProductSize", back_populates="product", lazy="selectin")
+
+    __table_args__ = (
+        Index("ix_products_category_id_id", "category_id", "id"),
+    )
@@ -0,0 +1,185 @@
+from app.core.database.postgresql import Base
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Computed, Index, DDL, event, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
+
+REFRESH_PRODUCT_READ_MODELS = """
+CREATE OR REPLACE FUNCTION refresh_product_read_models(product_ids integer[]) RETURNS void AS $$
+BEGIN
+    PERFORM 1 FROM product_read_models WHERE id = ANY(product_ids) ORDER BY id FOR NO KEY UPDATE;
+
+    INSERT INTO product_read_models (id, name, image, description, category_id, sizes, min_price, max_price, total_stock)
+    SELECT
+        p.id,
+        p.name,
+        p.image,
+        p.description,
+        p.category_id,
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object('size_id', ps.size_id, 'size_name', s.name, 'price', ps.price, 'stock', ps.stock)
+                ORDER BY s.display_order
+            ) FILTER (WHERE ps.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        min(ps.price),
+        max(ps.price),
+        coalesce(sum(ps.stock), 0)
+    FROM products p
+    LEFT JOIN product_sizes ps ON ps.product_id = p.id
+    LEFT JOIN sizes s ON s.id = ps.size_id
+    WHERE p.id = ANY(product_ids)
+    GROUP BY p.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        image = EXCLUDED.image,
+        description = EXCLUDED.description,
+        category_id = EXCLUDED.category_id,
+        sizes = EXCLUDED.sizes,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        total_stock = EXCLUDED.total_stock;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCTS_CHANGED = """
+CREATE OR REPLACE FUNCTION product_read_models_products_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_INSERTED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT DISTINCT product_id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM 1 FROM product_read_models
+    WHERE id IN (SELECT product_id FROM new_rows UNION SELECT product_id FROM old_rows)
+    ORDER BY id FOR NO KEY UPDATE;
+
+    UPDATE product_read_models r SET
+        sizes = (
+            SELECT coalesce(jsonb_agg(
+                CASE WHEN c.stocks ? (e->>'size_id') THEN jsonb_set(e, '{stock}', c.stocks -> (e->>'size_id')) ELSE e END
+                ORDER BY position
+            ), '[]'::jsonb)
+            FROM jsonb_array_elements(r.sizes) WITH ORDINALITY AS elements(e, position)
+        ),
+        total_stock = r.total_stock + c.delta
+    FROM (
+        SELECT n.product_id, jsonb_object_agg(n.size_id::text, n.stock) AS stocks, sum(n.stock - o.stock) AS delta
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id = o.product_id
+        AND n.size_id = o.size_id
+        AND n.price IS NOT DISTINCT FROM o.price
+        AND n.stock IS DISTINCT FROM o.stock
+        GROUP BY n.product_id
+    ) c
+    WHERE r.id = c.product_id;
+
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT n.product_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id <> o.product_id OR n.size_id <> o.size_id OR n.price IS DISTINCT FROM o.price
+        UNION
+        SELECT o.product_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE n.product_id <> o.product_id OR n.size_id <> o.size_id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRODUCT_SIZES_DELETED = """
+CREATE OR REPLACE FUNCTION product_read_models_product_sizes_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(SELECT DISTINCT product_id FROM old_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SIZES_UPDATED = """
+CREATE OR REPLACE FUNCTION product_read_models_sizes_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_product_read_models(ARRAY(
+        SELECT DISTINCT ps.product_id FROM product_sizes ps JOIN new_rows s ON s.id = ps.size_id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    "CREATE OR REPLACE TRIGGER product_read_models_products_inserted AFTER INSERT ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_products_changed()",
+    "CREATE OR REPLACE TRIGGER product_read_models_products_updated AFTER UPDATE ON products "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_products_changed()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_inserted AFTER INSERT ON product_sizes "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_inserted()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_updated AFTER UPDATE ON product_sizes "
+    "REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_updated()",
+    "CREATE OR REPLACE TRIGGER product_read_models_product_sizes_deleted AFTER DELETE ON product_sizes "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_product_sizes_deleted()",
+    "CREATE OR REPLACE TRIGGER product_read_models_sizes_updated AFTER UPDATE ON sizes "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION product_read_models_sizes_updated()",
+]
+
+BACKFILL = (
+    "SELECT refresh_product_read_models(ARRAY("
+    "SELECT p.id FROM products p WHERE NOT EXISTS (SELECT 1 FROM product_read_models r WHERE r.id = p.id)"
+    "))"
+)
+
+PRODUCT_READ_MODEL_DDL = [
+    REFRESH_PRODUCT_READ_MODELS,
+    PRODUCTS_CHANGED,
+    PRODUCT_SIZES_INSERTED,
+    PRODUCT_SIZES_UPDATED,
+    PRODUCT_SIZES_DELETED,
+    SIZES_UPDATED,
+    *TRIGGERS,
+    BACKFILL,
+]
+
+
+class ProductReadModel(Base):
+    __tablename__ = "product_read_models"
+
+    id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    name = Column(String, nullable=False)
+    image = Column(String)
+    description = Column(String)
+    category_id = Column(Integer, nullable=False)
+    sizes = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    min_price = Column(Float)
+    max_price = Column(Float)
+    total_stock = Column(Integer, nullable=False, server_default=text("0"))
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))", persisted=True)
+    ))
+
+    __table_args__ = (
+        Index("ix_product_read_models_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_product_read_models_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_product_read_models_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("ix_product_read_models_category_id_id", "category_id", "id"),
+        Index("ix_product_read_models_name_id", "name", "id"),
+        Index("ix_product_read_models_min_price_id", text("coalesce(min_price, 0.0)"), "id"),
+    )
+
+
+for statement in PRODUCT_READ_MODEL_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -1,5 +1,5 @@
 from app.core.database.postgresql import Base
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 class ProductSize(Base):
@@ -15,4 +15,6 @@ class ProductSize(Base):
 
     __table_args__ = (
         UniqueConstraint('product_id', 'size_id', name="uq_product_size"),
+        Index('ix_product_sizes_size_id_price', 'size_id', 'price'),
+        Index('ix_product_sizes_price', 'price'),
     )
\ No newline at end of file
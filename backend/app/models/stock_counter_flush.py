@@ -0,0 +1,10 @@
+from app.core.database.postgresql import Base
+from sqlalchemy import Column, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID
+
+
+class StockCounterFlush(Base):
+    __tablename__ = "stock_counter_flushes"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    flushed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
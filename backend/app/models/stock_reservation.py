@@ -0,0 +1,13 @@
+import uuid
+from app.core.database.postgresql import Base
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+
+class StockReservation(Base):
+    __tablename__ = "stock_reservations"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    product_size_id = Column(Integer, ForeignKey("product_sizes.id", ondelete="CASCADE"), nullable=False, index=True)
+    quantity = Column(Integer, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
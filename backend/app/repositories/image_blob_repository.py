@@ -0,0 +1,32 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Set
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from app.models.image_blob import ImageBlob
+
+
+class ImageBlobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def register_filename(self, filename: str):
+        query = insert(ImageBlob).values(filename=filename, ref_count=0).on_conflict_do_nothing()
+        await self.db.execute(query)
+        await self.db.commit()
+
+    async def get_unreferenced_filenames(self, filenames: List[str]) -> Set[str]:
+        query = select(ImageBlob.filename).where(
+            ImageBlob.filename.in_(filenames),
+            ImageBlob.ref_count == 0
+        )
+        result = await self.db.execute(query)
+
+        return set(result.scalars().all())
+
+    async def delete_unreferenced(self, filenames: List[str]):
+        query = delete(ImageBlob).where(
+            ImageBlob.filename.in_(filenames),
+            ImageBlob.ref_count == 0
+        )
+        await self.db.execute(query)
+        await self.db.commit()
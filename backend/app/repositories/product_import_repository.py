@@ -0,0 +1,85 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Tuple
+from sqlalchemy import text, RowMapping
+
+STAGING_TABLE = "product_import_staging"
+STAGING_COLUMNS = ["row_number", "name", "description", "category_id", "size_id", "price", "stock"]
+
+
+class ProductImportRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_staging_table(self):
+        await self.db.execute(text(f"""
+            CREATE TEMP TABLE {STAGING_TABLE} (
+                row_number integer NOT NULL,
+                name text NOT NULL,
+                description text,
+                category_id integer NOT NULL,
+                size_id integer,
+                price double precision,
+                stock integer
+            ) ON COMMIT DROP
+        """))
+
+    async def copy_rows(self, rows: List[Tuple]):
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            records=rows,
+            columns=STAGING_COLUMNS
+        )
+
+    async def reject_missing_references(self) -> List[Tuple[int, str]]:
+        missing_categories = await self.db.execute(text(f"""
+            DELETE FROM {STAGING_TABLE} s
+            WHERE NOT EXISTS (SELECT 1 FROM categories c WHERE c.id = s.category_id)
+            RETURNING s.row_number, s.category_id
+        """))
+        errors = [(row_number, f"Category with id {category_id} not found") for row_number, category_id in missing_categories]
+
+        missing_sizes = await self.db.execute(text(f"""
+            DELETE FROM {STAGING_TABLE} s
+            WHERE s.size_id IS NOT NULL
+            AND NOT EXISTS (SELECT 1 FROM sizes z WHERE z.id = s.size_id)
+            RETURNING s.row_number, s.size_id
+        """))
+        errors += [(row_number, f"Size with id {size_id} not found") for row_number, size_id in missing_sizes]
+
+        return errors
+
+    async def merge_products(self) -> int:
+        result = await self.db.execute(text(f"""
+            INSERT INTO products (name, description, category_id)
+            SELECT DISTINCT ON (name) name, description, category_id
+            FROM {STAGING_TABLE}
+            ORDER BY name, row_number DESC
+            ON CONFLICT (name) DO UPDATE SET
+                description = COALESCE(EXCLUDED.description, products.description),
+                category_id = EXCLUDED.category_id
+        """))
+        return result.rowcount
+
+    async def merge_product_sizes(self) -> List[RowMapping]:
+        result = await self.db.execute(text(f"""
+            INSERT INTO product_sizes (product_id, size_id, price, stock)
+            SELECT DISTINCT ON (p.id, s.size_id) p.id, s.size_id, s.price, s.stock
+            FROM {STAGING_TABLE} s
+            JOIN products p ON p.name = s.name
+            WHERE s.size_id IS NOT NULL
+            ORDER BY p.id, s.size_id, s.row_number DESC
+            ON CONFLICT (product_id, size_id) DO UPDATE SET
+                price = EXCLUDED.price,
+                stock = EXCLUDED.stock
+            RETURNING product_id, size_id, stock
+        """))
+        return result.mappings().all()
+
+    async def commit(self):
+        await self.db.commit()
+
+    async def rollback(self):
+        await self.db.rollback()
@@ -1,29 +1,167 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple
+from sqlalchemy import select, insert, update, delete, values, or_, func, cast, column, literal, literal_column, true, tuple_, Integer, Float, Text, String, Select, Row, RowMapping
 from app.models.product import Product
 from app.models.product_size import ProductSize
-from app.schemas.product import ProductCreate, ProductSizeAdd, ProductSizeUpdate
+from app.models.product_read_model import ProductReadModel
+from app.schemas.product import ProductCreate, ProductSizeAdd, ProductSizeUpdate, ProductSizeBatchItem, ProductFilter, ProductSort, ProductExportFormat
+from app.core.constants import PRODUCT_STREAM_BATCH_SIZE, PRODUCT_SEARCH_LIMIT, PRODUCT_EXPORT_BATCH_SIZE
 
 
 class ProductRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_products(self) -> List[Product]:
-        query = select(Product).options(
-            selectinload(Product.product_sizes).selectinload(ProductSize.size)
+    def _product_rows_query(self) -> Select:
+        return select(
+            ProductReadModel.id,
+            ProductReadModel.name,
+            ProductReadModel.image,
+            ProductReadModel.description,
+            ProductReadModel.category_id,
+            ProductReadModel.sizes
         )
 
+    def _apply_filters(self, query: Select, filters: ProductFilter) -> Select:
+        if filters.category_id is not None:
+            query = query.where(ProductReadModel.category_id == filters.category_id)
+
+        size_conditions = []
+        if filters.size_id is not None:
+            size_conditions.append(ProductSize.size_id == filters.size_id)
+        if filters.min_price is not None:
+            size_conditions.append(ProductSize.price >= filters.min_price)
+        if filters.max_price is not None:
+            size_conditions.append(ProductSize.price <= filters.max_price)
+        if filters.in_stock:
+            size_conditions.append(ProductSize.stock > 0)
+
+        if size_conditions:
+            query = query.where(
+                select(ProductSize.id).where(ProductSize.product_id == ProductReadModel.id, *size_conditions).exists()
+            )
+
+        return query
+
+    def _apply_sort(self, query: Select, sort: ProductSort, after: Optional[dict]) -> Select:
+        if sort == ProductSort.id:
+            if after is not None:
+                query = query.where(ProductReadModel.id > after["id"])
+            return query.order_by(ProductReadModel.id)
+
+        if sort == ProductSort.name:
+            sort_key = ProductReadModel.name
+        else:
+            sort_key = func.coalesce(ProductReadModel.min_price, literal_column("0.0"))
+
+        query = query.add_columns(sort_key.label("sort_key"))
+
+        if sort == ProductSort.price_desc:
+            if after is not None:
+                query = query.where(tuple_(sort_key, ProductReadModel.id) < tuple_(after["key"], after["id"]))
+            return query.order_by(sort_key.desc(), ProductReadModel.id.desc())
+
+        if after is not None:
+            query = query.where(tuple_(sort_key, ProductReadModel.id) > tuple_(after["key"], after["id"]))
+        return query.order_by(sort_key, ProductReadModel.id)
+
+    async def get_product_rows(self, filters: ProductFilter, limit: int, after: Optional[dict] = None) -> List[RowMapping]:
+        query = self._apply_filters(self._product_rows_query(), filters)
+        query = self._apply_sort(query, filters.sort, after).limit(limit)
+
         result = await self.db.execute(query)
-        return result.scalars().all()
+        return result.mappings().all()
+
+    async def stream_product_rows(self, filters: ProductFilter, after: Optional[dict] = None) -> AsyncIterator[RowMapping]:
+        query = self._apply_filters(self._product_rows_query(), filters)
+        query = self._apply_sort(query, filters.sort, after).execution_options(yield_per=PRODUCT_STREAM_BATCH_SIZE)
+
+        result = await self.db.stream(query)
+        async for row in result.mappings():
+            yield row
+
+    def _product_export_query(self, export_format: ProductExportFormat) -> Select:
+        if export_format == ProductExportFormat.ndjson:
+            return select(cast(func.json_build_object(
+                "id", ProductReadModel.id,
+                "name", ProductReadModel.name,
+                "image", ProductReadModel.image,
+                "description", ProductReadModel.description,
+                "category_id", ProductReadModel.category_id,
+                "sizes", ProductReadModel.sizes
+            ), Text))
+
+        size_elements = func.jsonb_to_recordset(ProductReadModel.sizes).table_valued(
+            column("size_id", Integer),
+            column("size_name", String),
+            column("price", Float),
+            column("stock", Integer)
+        ).render_derived(name="size_elements", with_types=True).lateral("size_elements")
+
+        return select(
+            ProductReadModel.id,
+            ProductReadModel.name,
+            ProductReadModel.description,
+            ProductReadModel.category_id,
+            ProductReadModel.image,
+            size_elements.c.size_id,
+            size_elements.c.size_name,
+            size_elements.c.price,
+            size_elements.c.stock
+        ).select_from(ProductReadModel).outerjoin(size_elements, true())
+
+    async def export_product_rows(self, filters: ProductFilter, export_format: ProductExportFormat) -> AsyncIterator[Sequence[Row]]:
+        query = self._apply_filters(self._product_export_query(export_format), filters)
+        query = self._apply_sort(query, filters.sort, None).execution_options(yield_per=PRODUCT_EXPORT_BATCH_SIZE)
+
+        result = await self.db.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_product_facets(self, filters: ProductFilter) -> dict:
+        size_elements = func.jsonb_to_recordset(ProductReadModel.sizes).table_valued(
+            column("size_id", Integer)
+        ).render_derived(name="size_elements", with_types=True).lateral("size_elements")
+
+        query = select(
+            func.grouping(ProductReadModel.category_id).label("by_size"),
+            ProductReadModel.category_id,
+            size_elements.c.size_id,
+            func.count(func.distinct(ProductReadModel.id)).label("count")
+        ).select_from(ProductReadModel).outerjoin(size_elements, true())
+
+        query = self._apply_filters(query, filters).group_by(
+            func.grouping_sets(tuple_(ProductReadModel.category_id), tuple_(size_elements.c.size_id))
+        )
+
+        result = await self.db.execute(query)
+
+        facets = {"categories": [], "sizes": []}
+        for row in result.mappings():
+            if row["by_size"]:
+                if row["size_id"] is not None:
+                    facets["sizes"].append({"id": row["size_id"], "count": row["count"]})
+            else:
+                facets["categories"].append({"id": row["category_id"], "count": row["count"]})
+
+        for counts in facets.values():
+            counts.sort(key=lambda facet: (-facet["count"], facet["id"]))
+
+        return facets
+
+    async def create_product(self, product_data: ProductCreate) -> RowMapping:
+        query = insert(Product).values(**product_data.model_dump()).returning(
+            Product.id,
+            Product.name,
+            Product.image,
+            Product.description,
+            Product.category_id
+        )
 
-    async def create_product(self, product_data: ProductCreate) -> Product:
-        product = Product(**product_data.model_dump())
-        self.db.add(product)
+        result = await self.db.execute(query)
+        product = result.mappings().one()
         await self.db.commit()
-        await self.db.refresh(product)
+
         return product
 
     async def get_product_by_id(self, product_id: int) -> Product:
@@ -36,110 +174,147 @@ class ProductRepository:
             raise ValueError(f"Product with id {product_id} not found")
         return product
 
-    async def add_size_to_product(self, product_id: int, size_data: ProductSizeAdd) -> Product:
-        query = select(Product).where(Product.id == product_id)
+    async def _get_product_row(self, product_id: int) -> RowMapping:
+        query = self._product_rows_query().where(ProductReadModel.id == product_id)
         result = await self.db.execute(query)
 
-        product = result.scalar_one_or_none()
+        return result.mappings().one()
 
-        if not product:
-            raise ValueError(f"Product with id {product_id} not found")
-
-        product_size = ProductSize(
-            product_id=product_id,
-            size_id=size_data.size_id,
-            price=size_data.price,
-            stock=size_data.stock
-        )
-        self.db.add(product_size)
-        await self.db.commit()
-
-        query = select(Product).options(
-            selectinload(Product.product_sizes).selectinload(ProductSize.size)
+    async def add_size_to_product(self, product_id: int, size_data: ProductSizeAdd) -> RowMapping:
+        product_exists = select(
+            Product.id,
+            literal(size_data.size_id),
+            literal(size_data.price),
+            literal(size_data.stock)
         ).where(Product.id == product_id)
 
+        query = insert(ProductSize).from_select(
+            ["product_id", "size_id", "price", "stock"],
+            product_exists
+        ).returning(ProductSize.id)
+
         result = await self.db.execute(query)
-        product = result.scalar_one_or_none()
 
-        return product
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
+            raise ValueError(f"Product with id {product_id} not found")
 
-    async def delete_size_from_product(self, product_id: int, size_id: int) -> Product:
-        query = select(Product).where(Product.id == product_id)
-        result = await self.db.execute(query)
+        product = await self._get_product_row(product_id)
+        await self.db.commit()
 
-        product = result.scalar_one_or_none()
+        return product
 
-        if not product:
+    async def delete_product(self, product_id: int) -> RowMapping:
+        query = self._product_rows_query().where(ProductReadModel.id == product_id)
+        product = (await self.db.execute(query)).mappings().one_or_none()
+
+        if product is None:
             raise ValueError(f"Product with id {product_id} not found")
 
-        query = select(ProductSize).where(
+        await self.db.execute(delete(Product).where(Product.id == product_id))
+        await self.db.commit()
+
+        return product
+
+    async def delete_size_from_product(self, product_id: int, size_id: int) -> RowMapping:
+        query = delete(ProductSize).where(
             ProductSize.product_id == product_id,
             ProductSize.size_id == size_id
-        )
+        ).returning(ProductSize.id)
 
         result = await self.db.execute(query)
-        product_size = result.scalar_one_or_none()
 
-        if not product_size:
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
             raise ValueError(f"Size with id {size_id} not found for this product")
 
-        await self.db.delete(product_size)
+        product = await self._get_product_row(product_id)
         await self.db.commit()
 
-        query = select(Product).options(
-            selectinload(Product.product_sizes).selectinload(ProductSize.size)
-        ).where(Product.id == product_id)
-
-        result = await self.db.execute(query)
-        product = result.scalar_one_or_none()
-
         return product
 
-    async def update_product_size(self, product_id: int, size_id: int, size_data: ProductSizeUpdate) -> Product:
-        query = select(Product).where(Product.id == product_id)
-        result = await self.db.execute(query)
-        product = result.scalar_one_or_none()
-
-        if not product:
-            raise ValueError(f"Product with id {product_id} not found")
+    async def update_product_size(
+        self,
+        product_id: int,
+        size_id: int,
+        size_data: ProductSizeUpdate,
+        before_commit: Optional[Callable[[], Awaitable]] = None
+    ) -> RowMapping:
+        values = size_data.model_dump(exclude_none=True)
 
-        query = select(ProductSize).where(
+        query = update(ProductSize).where(
             ProductSize.product_id == product_id,
             ProductSize.size_id == size_id
-        )
+        ).values(**values).returning(ProductSize.id)
+
+        if not values:
+            query = select(ProductSize.id).where(
+                ProductSize.product_id == product_id,
+                ProductSize.size_id == size_id
+            )
+
         result = await self.db.execute(query)
-        product_size = result.scalar_one_or_none()
 
-        if not product_size:
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
             raise ValueError(f"Size with id {size_id} not found for this product")
 
-        if size_data.price is not None:
-            product_size.price = size_data.price
-
-        if size_data.stock is not None:
-            product_size.stock = size_data.stock
+        if before_commit is not None:
+            await before_commit()
 
+        product = await self._get_product_row(product_id)
         await self.db.commit()
 
-        query = select(Product).options(
-            selectinload(Product.product_sizes).selectinload(ProductSize.size)
-        ).where(Product.id == product_id)
-    
+        return product
+
+    async def get_product_rows_by_ids(self, product_ids: List[int]) -> List[RowMapping]:
+        query = self._product_rows_query().where(ProductReadModel.id.in_(product_ids))
         result = await self.db.execute(query)
-        product = result.scalar_one_or_none()
 
-        return product
+        return result.mappings().all()
+
+    async def update_product_sizes_batch(
+        self,
+        items: List[ProductSizeBatchItem],
+        before_commit: Optional[Callable[[List[RowMapping]], Awaitable]] = None
+    ) -> List[RowMapping]:
+        changes = values(
+            column("product_id", Integer),
+            column("size_id", Integer),
+            column("price", Float),
+            column("stock", Integer),
+            name="changes"
+        ).data([(item.product_id, item.size_id, item.price, item.stock) for item in items])
+
+        query = update(ProductSize).where(
+            ProductSize.product_id == changes.c.product_id,
+            ProductSize.size_id == changes.c.size_id
+        ).values(
+            price=func.coalesce(changes.c.price, ProductSize.price),
+            stock=func.coalesce(changes.c.stock, ProductSize.stock)
+        ).returning(ProductSize.product_id, ProductSize.size_id, ProductSize.price, ProductSize.stock)
+
+        result = await self.db.execute(query)
+        updated = result.mappings().all()
+        if before_commit is not None:
+            await before_commit(updated)
+        await self.db.commit()
 
-    async def search_products(self, query_text: str) -> List[Product]:
+        return updated
+
+    async def search_product_rows(self, query_text: str) -> List[RowMapping]:
         search_pattern = f"%{query_text}%"
-        query = select(Product).options(
-            selectinload(Product.product_sizes).selectinload(ProductSize.size)
-        ).where(
-            or_(Product.name.ilike(search_pattern),
-            Product.description.ilike(search_pattern)
+        ts_query = func.websearch_to_tsquery("simple", query_text)
+        rank = func.ts_rank(ProductReadModel.search_vector, ts_query) + func.similarity(ProductReadModel.name, query_text)
+
+        query = self._product_rows_query().where(
+            or_(ProductReadModel.search_vector.op("@@")(ts_query),
+            ProductReadModel.name.ilike(search_pattern),
+            ProductReadModel.description.ilike(search_pattern),
+            ProductReadModel.name.op("%")(query_text)
             )
-        )
+        ).order_by(rank.desc(), ProductReadModel.id).limit(PRODUCT_SEARCH_LIMIT)
 
         result = await self.db.execute(query)
 
-        return result.scalars().all()
+        return result.mappings().all()
@@ -0,0 +1,90 @@
+import uuid
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, update, delete, values, column, func, tuple_, Integer
+from sqlalchemy.dialects.postgresql import insert
+from app.models.product_size import ProductSize
+from app.models.stock_counter_flush import StockCounterFlush
+from app.core.constants import STOCK_COUNTER_FLUSH_RETENTION_DAYS
+
+
+class StockCounterRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_stock(self, product_id: int, size_id: int) -> Optional[int]:
+        query = select(ProductSize.stock).where(
+            ProductSize.product_id == product_id,
+            ProductSize.size_id == size_id
+        )
+
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def lock_product_size(self, product_id: int, size_id: int) -> Optional[int]:
+        query = select(ProductSize.stock).where(
+            ProductSize.product_id == product_id,
+            ProductSize.size_id == size_id
+        ).with_for_update()
+
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def _increment_stock(self, deltas: Dict[Tuple[int, int], int]) -> List[int]:
+        changes = values(
+            column("product_id", Integer),
+            column("size_id", Integer),
+            column("delta", Integer),
+            name="changes"
+        ).data([(product_id, size_id, delta) for (product_id, size_id), delta in deltas.items()])
+
+        query = update(ProductSize).where(
+            ProductSize.product_id == changes.c.product_id,
+            ProductSize.size_id == changes.c.size_id
+        ).values(stock=ProductSize.stock + changes.c.delta).returning(ProductSize.product_id)
+
+        result = await self.db.execute(query)
+        return list(set(result.scalars().all()))
+
+    async def increment_stock(self, deltas: Dict[Tuple[int, int], int]) -> List[int]:
+        if not deltas:
+            return []
+
+        product_ids = await self._increment_stock(deltas)
+        await self.db.commit()
+
+        return product_ids
+
+    async def claim_flush(self, batch_id: uuid.UUID, skus: List[Tuple[int, int]]) -> bool:
+        query = insert(StockCounterFlush).values(id=batch_id).on_conflict_do_nothing().returning(StockCounterFlush.id)
+        result = await self.db.execute(query)
+
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
+            return False
+
+        if skus:
+            await self.db.execute(
+                select(ProductSize.id)
+                .where(tuple_(ProductSize.product_id, ProductSize.size_id).in_(skus))
+                .order_by(ProductSize.id)
+                .with_for_update()
+            )
+        return True
+
+    async def complete_flush(self, deltas: Dict[Tuple[int, int], int]) -> List[int]:
+        product_ids = await self._increment_stock(deltas) if deltas else []
+
+        await self.db.execute(delete(StockCounterFlush).where(
+            StockCounterFlush.flushed_at < func.now() - timedelta(days=STOCK_COUNTER_FLUSH_RETENTION_DAYS)
+        ))
+        await self.db.commit()
+
+        return product_ids
+
+    async def commit(self):
+        await self.db.commit()
+
+    async def rollback(self):
+        await self.db.rollback()
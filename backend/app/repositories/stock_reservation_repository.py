@@ -0,0 +1,216 @@
+import uuid
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, insert, update, delete, func, literal, true, Interval, RowMapping
+from sqlalchemy.dialects.postgresql import UUID
+from app.models.product_size import ProductSize
+from app.models.stock_reservation import StockReservation
+from app.core.constants import STOCK_RESERVATION_SWEEP_BATCH_SIZE
+
+
+class StockReservationRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def product_size_exists(self, product_id: int, size_id: int) -> bool:
+        query = select(ProductSize.id).where(
+            ProductSize.product_id == product_id,
+            ProductSize.size_id == size_id
+        )
+        result = await self.db.execute(query)
+
+        return result.scalar_one_or_none() is not None
+
+    async def decrement_stock(self, product_id: int, size_id: int, quantity: int) -> Optional[RowMapping]:
+        query = update(ProductSize).where(
+            ProductSize.product_id == product_id,
+            ProductSize.size_id == size_id,
+            ProductSize.stock >= quantity
+        ).values(stock=ProductSize.stock - quantity).returning(
+            ProductSize.product_id,
+            ProductSize.size_id,
+            ProductSize.stock
+        )
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def reserve_stock(self, product_id: int, size_id: int, quantity: int, ttl_seconds: int) -> Optional[RowMapping]:
+        decremented = update(ProductSize).where(
+            ProductSize.product_id == product_id,
+            ProductSize.size_id == size_id,
+            ProductSize.stock >= quantity
+        ).values(stock=ProductSize.stock - quantity).returning(
+            ProductSize.id,
+            ProductSize.product_id,
+            ProductSize.size_id,
+            ProductSize.stock
+        ).cte("decremented")
+
+        reserved = insert(StockReservation).from_select(
+            ["id", "product_size_id", "quantity", "expires_at"],
+            select(
+                literal(uuid.uuid4(), UUID(as_uuid=True)),
+                decremented.c.id,
+                literal(quantity),
+                func.now() + literal(timedelta(seconds=ttl_seconds), Interval)
+            )
+        ).returning(
+            StockReservation.id,
+            StockReservation.quantity,
+            StockReservation.expires_at
+        ).cte("reserved")
+
+        query = select(
+            reserved.c.id,
+            decremented.c.product_id,
+            decremented.c.size_id,
+            reserved.c.quantity,
+            decremented.c.stock,
+            reserved.c.expires_at
+        ).select_from(reserved).join(decremented, true())
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def create_reservation(self, product_id: int, size_id: int, quantity: int, ttl_seconds: int) -> Optional[RowMapping]:
+        query = insert(StockReservation).from_select(
+            ["id", "product_size_id", "quantity", "expires_at"],
+            select(
+                literal(uuid.uuid4(), UUID(as_uuid=True)),
+                ProductSize.id,
+                literal(quantity),
+                func.now() + literal(timedelta(seconds=ttl_seconds), Interval)
+            ).where(
+                ProductSize.product_id == product_id,
+                ProductSize.size_id == size_id
+            )
+        ).returning(
+            StockReservation.id,
+            StockReservation.quantity,
+            StockReservation.expires_at
+        )
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def commit_reservation(self, reservation_id: uuid.UUID) -> Optional[RowMapping]:
+        query = delete(StockReservation).where(
+            StockReservation.id == reservation_id,
+            StockReservation.expires_at > func.now(),
+            ProductSize.id == StockReservation.product_size_id
+        ).returning(
+            StockReservation.id,
+            ProductSize.product_id,
+            ProductSize.size_id,
+            StockReservation.quantity,
+            ProductSize.stock
+        )
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def release_reservation(self, reservation_id: uuid.UUID) -> Optional[RowMapping]:
+        released = delete(StockReservation).where(
+            StockReservation.id == reservation_id
+        ).returning(
+            StockReservation.id,
+            StockReservation.product_size_id,
+            StockReservation.quantity
+        ).cte("released")
+
+        query = update(ProductSize).where(
+            ProductSize.id == released.c.product_size_id
+        ).values(stock=ProductSize.stock + released.c.quantity).returning(
+            released.c.id,
+            ProductSize.product_id,
+            ProductSize.size_id,
+            released.c.quantity,
+            ProductSize.stock
+        )
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def delete_reservation(self, reservation_id: uuid.UUID) -> Optional[RowMapping]:
+        query = delete(StockReservation).where(
+            StockReservation.id == reservation_id,
+            ProductSize.id == StockReservation.product_size_id
+        ).returning(
+            StockReservation.id,
+            ProductSize.product_id,
+            ProductSize.size_id,
+            StockReservation.quantity
+        )
+
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        await self.db.commit()
+
+        return row
+
+    async def delete_expired_reservations(self) -> Dict[Tuple[int, int], int]:
+        expired_ids = select(StockReservation.id).where(
+            StockReservation.expires_at <= func.now()
+        ).limit(STOCK_RESERVATION_SWEEP_BATCH_SIZE).with_for_update(skip_locked=True)
+
+        query = delete(StockReservation).where(
+            StockReservation.id.in_(expired_ids.scalar_subquery()),
+            ProductSize.id == StockReservation.product_size_id
+        ).returning(
+            ProductSize.product_id,
+            ProductSize.size_id,
+            StockReservation.quantity
+        )
+
+        result = await self.db.execute(query)
+
+        released = {}
+        for product_id, size_id, quantity in result.all():
+            released[(product_id, size_id)] = released.get((product_id, size_id), 0) + quantity
+        await self.db.commit()
+
+        return released
+
+    async def release_expired_reservations(self) -> List[int]:
+        expired_ids = select(StockReservation.id).where(
+            StockReservation.expires_at <= func.now()
+        ).limit(STOCK_RESERVATION_SWEEP_BATCH_SIZE).with_for_update(skip_locked=True)
+
+        expired = delete(StockReservation).where(
+            StockReservation.id.in_(expired_ids.scalar_subquery())
+        ).returning(
+            StockReservation.product_size_id,
+            StockReservation.quantity
+        ).cte("expired")
+
+        totals = select(
+            expired.c.product_size_id,
+            func.sum(expired.c.quantity).label("quantity")
+        ).group_by(expired.c.product_size_id).cte("totals")
+
+        query = update(ProductSize).where(
+            ProductSize.id == totals.c.product_size_id
+        ).values(stock=ProductSize.stock + totals.c.quantity).returning(ProductSize.product_id)
+
+        result = await self.db.execute(query)
+        product_ids = list(set(result.scalars().all()))
+        await self.db.commit()
+
+        return product_ids
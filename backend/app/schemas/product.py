@@ -1,6 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional, List, Union
-from fastapi import Form
+from pydantic import BaseModel, Field, model_validator, computed_field
+from typing import Optional, List, Dict, Union
+from enum import Enum
+from fastapi import Form, Query
+from app.core.constants import PRODUCT_SIZE_BATCH_MAX_ITEMS
+from app.utils.image_variants import get_image_variant_urls
 
 
 class ProductBase(BaseModel):
@@ -39,14 +42,66 @@ class ProductItem(ProductBase):
     id: int
     sizes: Optional[List[ProductSizeDetail]] = []
 
+    @computed_field
+    @property
+    def image_variants(self) -> Optional[Dict[str, str]]:
+        return get_image_variant_urls(self.image) if self.image else None
+
     class Config:
         from_attributes = True
 
 
+class ProductSort(str, Enum):
+    id = "id"
+    name = "name"
+    price_asc = "price_asc"
+    price_desc = "price_desc"
+
+
+class ProductFilter(BaseModel):
+    category_id: Optional[int] = None
+    size_id: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    in_stock: bool = False
+    sort: ProductSort = ProductSort.id
+
+    @classmethod
+    def as_query(
+        cls,
+        category_id: Optional[int] = Query(None),
+        size_id: Optional[int] = Query(None),
+        min_price: Optional[float] = Query(None, ge=0),
+        max_price: Optional[float] = Query(None, ge=0),
+        in_stock: bool = Query(False),
+        sort: ProductSort = Query(ProductSort.id)
+    ):
+        return cls(
+            category_id=category_id,
+            size_id=size_id,
+            min_price=min_price,
+            max_price=max_price,
+            in_stock=in_stock,
+            sort=sort
+        )
+
+
+class FacetCount(BaseModel):
+    id: int
+    count: int
+
+
+class ProductFacets(BaseModel):
+    categories: List[FacetCount] = []
+    sizes: List[FacetCount] = []
+
+
 class ProductResponse(BaseModel):
     success: bool
     message: Optional[str] = None
     data: Optional[Union[ProductItem, List[ProductItem]]] = None
+    next_cursor: Optional[str] = None
+    facets: Optional[ProductFacets] = None
 
     class Config:
         from_attributes = True
@@ -60,4 +115,95 @@ class ProductSizeAdd(BaseModel):
 
 class ProductSizeUpdate(BaseModel):
     price: Optional[float] = None
-    stock: Optional[int] = None
\ No newline at end of file
+    stock: Optional[int] = None
+
+
+class ProductSizeKey(BaseModel):
+    product_id: int
+    size_id: int
+
+
+class ProductSizeBatchItem(ProductSizeKey):
+    price: Optional[float] = None
+    stock: Optional[int] = None
+
+
+class ProductSizeBatchUpdate(BaseModel):
+    items: List[ProductSizeBatchItem] = Field(..., min_length=1, max_length=PRODUCT_SIZE_BATCH_MAX_ITEMS)
+
+
+class ProductSizeBatchResult(BaseModel):
+    updated: int
+    not_found: List[ProductSizeKey] = []
+
+
+class ProductSizeBatchResponse(BaseModel):
+    success: bool
+    message: Optional[str] = None
+    data: Optional[ProductSizeBatchResult] = None
+
+
+class ProductImportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ProductImportRow(BaseModel):
+    name: str
+    description: Optional[str] = None
+    category_id: int
+    size_id: Optional[int] = None
+    price: Optional[float] = None
+    stock: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_size_fields(self):
+        if self.size_id is not None and (self.price is None or self.stock is None):
+            raise ValueError("price and stock are required when size_id is set")
+        return self
+
+
+class ProductImportError(BaseModel):
+    row: int
+    error: str
+
+
+class ProductImportResult(BaseModel):
+    rows: int
+    products: int
+    sizes: int
+    errors: List[ProductImportError] = []
+
+
+class ProductImportResponse(BaseModel):
+    success: bool
+    message: Optional[str] = None
+    data: Optional[ProductImportResult] = None
+
+
+class ProductExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ProductChangeType(str, Enum):
+    product_created = "product.created"
+    product_deleted = "product.deleted"
+    size_added = "size.added"
+    size_removed = "size.removed"
+    size_updated = "size.updated"
+
+
+class ProductChangeEvent(BaseModel):
+    type: ProductChangeType
+    product_id: int
+    size_id: Optional[int] = None
+    name: Optional[str] = None
+    category_id: Optional[int] = None
+    price: Optional[float] = None
+    stock: Optional[int] = None
+
+
+class StockSubscription(BaseModel):
+    subscribe: List[int] = []
+    unsubscribe: List[int] = []
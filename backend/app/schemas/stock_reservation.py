@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+
+
+class StockChange(BaseModel):
+    product_id: int
+    size_id: int
+    quantity: int = Field(..., gt=0)
+
+
+class StockReservationCreate(StockChange):
+    ttl_seconds: int = Field(900, ge=1, le=86400)
+
+
+class StockReservationItem(BaseModel):
+    id: Optional[UUID] = None
+    product_id: int
+    size_id: int
+    quantity: int
+    stock: int
+    expires_at: Optional[datetime] = None
+
+
+class StockReservationResponse(BaseModel):
+    success: bool
+    message: Optional[str] = None
+    data: Optional[StockReservationItem] = None
+
+
+class StockCounterItem(BaseModel):
+    product_id: int
+    size_id: int
+    stock: int
+    hot: bool
+
+
+class StockCounterResponse(BaseModel):
+    success: bool
+    message: Optional[str] = None
+    data: Optional[StockCounterItem] = None
@@ -1,6 +1,8 @@
 from app.repositories.category_repository import CategoryRepository
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.models.category import Category
+from app.core.cache.tiered import cache
+from app.core.constants import REDIS_KEYS
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,14 +11,29 @@ class CategoryService:
     def __init__(self, db: AsyncSession):
         self.category_repository = CategoryRepository(db)
 
+    async def get_generation(self) -> int:
+        return await cache.get_generation(REDIS_KEYS["category"]["generation"])
+
+    async def _bump_generation(self):
+        try:
+            await cache.incr(REDIS_KEYS["category"]["generation"])
+        except Exception:
+            pass
+
     async def get_all_categories(self) -> List[Category]:
         return await self.category_repository.get_all_categories()
 
     async def create_category(self, category_data: CategoryCreate) -> Category:
-        return await self.category_repository.create_category(category_data)
+        category = await self.category_repository.create_category(category_data)
+        await self._bump_generation()
+        return category
 
     async def update_category(self, category_id: int, category_data: CategoryUpdate) -> Category:
-        return await self.category_repository.update_category(category_id, category_data)
+        category = await self.category_repository.update_category(category_id, category_data)
+        await self._bump_generation()
+        return category
 
     async def delete_category(self, category_id: int) -> Category:
-        return await self.category_repository.delete_category(category_id)
+        category = await self.category_repository.delete_category(category_id)
+        await self._bump_generation()
+        return category
@@ -0,0 +1,73 @@
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.image_blob_repository import ImageBlobRepository
+from app.utils.image_variants import UPLOAD_DIR, get_image_variant_paths
+from app.core.constants import IMAGE_GC_GRACE_PERIOD, IMAGE_GC_BATCH_SIZE
+
+
+def _iter_expired_uploads(cutoff: float) -> Iterator[Path]:
+    for path in UPLOAD_DIR.iterdir():
+        if "_" in path.stem or not path.is_file():
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                yield path
+        except FileNotFoundError:
+            continue
+
+
+def _is_expired(path: Path, cutoff: float) -> bool:
+    try:
+        return path.stat().st_mtime < cutoff
+    except FileNotFoundError:
+        return True
+
+
+def _remove_blobs(filenames: List[str], cutoff: float) -> List[str]:
+    removed = []
+    for filename in filenames:
+        if not _is_expired(UPLOAD_DIR / filename, cutoff):
+            continue
+        for path in [UPLOAD_DIR / filename, *get_image_variant_paths(filename)]:
+            path.unlink(missing_ok=True)
+        removed.append(filename)
+    return removed
+
+
+class ImageBlobService:
+    def __init__(self, db: AsyncSession):
+        self.image_blob_repository = ImageBlobRepository(db)
+
+    async def register_upload(self, filename: str):
+        await self.image_blob_repository.register_filename(filename)
+
+    async def collect_garbage(self) -> int:
+        if not await run_in_threadpool(UPLOAD_DIR.exists):
+            return 0
+
+        cutoff = time.time() - IMAGE_GC_GRACE_PERIOD
+        expired = _iter_expired_uploads(cutoff)
+        removed = 0
+
+        while True:
+            batch = await run_in_threadpool(lambda: [path.name for path in islice(expired, IMAGE_GC_BATCH_SIZE)])
+            if not batch:
+                break
+
+            partials = [filename for filename in batch if filename.endswith(".part")]
+            blobs = [filename for filename in batch if not filename.endswith(".part")]
+
+            unreferenced = await self.image_blob_repository.get_unreferenced_filenames(blobs) if blobs else set()
+            unreferenced = [filename for filename in blobs if filename in unreferenced]
+
+            deleted = await run_in_threadpool(_remove_blobs, partials + unreferenced, cutoff)
+            unreferenced = [filename for filename in deleted if not filename.endswith(".part")]
+            if unreferenced:
+                await self.image_blob_repository.delete_unreferenced(unreferenced)
+            removed += len(deleted)
+
+        return removed
@@ -0,0 +1,50 @@
+import csv
+import io
+import zlib
+from typing import AsyncIterator, Sequence
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.product_repository import ProductRepository
+from app.schemas.product import ProductFilter, ProductExportFormat
+
+CSV_COLUMNS = ["id", "name", "description", "category_id", "image", "size_id", "size_name", "price", "stock"]
+
+
+def _render_csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(row[:len(CSV_COLUMNS)] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _render_ndjson(rows: Sequence[Row]) -> bytes:
+    return "".join(row[0] + "\n" for row in rows).encode()
+
+
+class ProductExportService:
+    def __init__(self, db: AsyncSession):
+        self.product_repository = ProductRepository(db)
+
+    async def _export_chunks(self, filters: ProductFilter, export_format: ProductExportFormat) -> AsyncIterator[bytes]:
+        if export_format == ProductExportFormat.csv:
+            yield (",".join(CSV_COLUMNS) + "\r\n").encode()
+            render = _render_csv
+        else:
+            render = _render_ndjson
+
+        async for rows in self.product_repository.export_product_rows(filters, export_format):
+            yield render(rows)
+
+    async def export_products(self, filters: ProductFilter, export_format: ProductExportFormat, gzip: bool = False) -> AsyncIterator[bytes]:
+        if not gzip:
+            async for chunk in self._export_chunks(filters, export_format):
+                yield chunk
+            return
+
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        async for chunk in self._export_chunks(filters, export_format):
+            compressed = await run_in_threadpool(compressor.compress, chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.product_import_repository import ProductImportRepository
+from app.schemas.product import ProductImportFormat, ProductImportRow, ProductImportError, ProductImportResult
+from app.services.product_service import ProductService
+from app.core.search.build_index import build_product_search_index
+from app.core.search.inverted_index import product_search_index
+from app.core.stock.counters import stock_counters
+from app.core.config import settings
+from app.core.constants import PRODUCT_IMPORT_CHUNK_SIZE, PRODUCT_IMPORT_MAX_ERRORS
+
+
+def _format_validation_error(exception: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exception.errors()
+    )
+
+
+def _iter_records(file: UploadFile, import_format: ProductImportFormat) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+
+    if import_format == ProductImportFormat.csv:
+        for row_number, record in enumerate(csv.DictReader(stream), start=1):
+            yield row_number, {key: value for key, value in record.items() if value != ""}, None
+        return
+
+    for row_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield row_number, None, "Row must be a JSON object"
+            continue
+        yield row_number, record, None
+
+
+class ProductImportService:
+    def __init__(self, db: AsyncSession):
+        self.product_import_repository = ProductImportRepository(db)
+        self.product_service = ProductService(db)
+
+    async def import_products(self, file: UploadFile, import_format: ProductImportFormat) -> ProductImportResult:
+        records = _iter_records(file, import_format)
+        errors: List[ProductImportError] = []
+        total_rows = 0
+
+        def add_error(row_number: int, message: str):
+            if len(errors) < PRODUCT_IMPORT_MAX_ERRORS:
+                errors.append(ProductImportError(row=row_number, error=message))
+
+        try:
+            await self.product_import_repository.create_staging_table()
+
+            while True:
+                chunk = await run_in_threadpool(lambda: list(islice(records, PRODUCT_IMPORT_CHUNK_SIZE)))
+                if not chunk:
+                    break
+
+                staged_rows = []
+                for row_number, record, parse_error in chunk:
+                    total_rows += 1
+                    if parse_error is not None:
+                        add_error(row_number, parse_error)
+                        continue
+                    try:
+                        row = ProductImportRow.model_validate(record)
+                    except ValidationError as e:
+                        add_error(row_number, _format_validation_error(e))
+                        continue
+                    staged_rows.append((
+                        row_number, row.name, row.description, row.category_id,
+                        row.size_id, row.price, row.stock
+                    ))
+
+                if staged_rows:
+                    await self.product_import_repository.copy_rows(staged_rows)
+
+            for row_number, message in await self.product_import_repository.reject_missing_references():
+                add_error(row_number, message)
+
+            products = await self.product_import_repository.merge_products()
+            sizes = await self.product_import_repository.merge_product_sizes()
+            if settings.hot_stock_enabled:
+                await stock_counters.overwrite_many((row["product_id"], row["size_id"], row["stock"]) for row in sizes)
+            await self.product_import_repository.commit()
+        except Exception:
+            await self.product_import_repository.rollback()
+            raise
+
+        await self.product_service.invalidate_search_cache()
+        await self.product_service.publish_resync()
+        if product_search_index.ready:
+            await build_product_search_index()
+
+        errors.sort(key=lambda error: error.row)
+        return ProductImportResult(rows=total_rows, products=products, sizes=len(sizes), errors=errors)
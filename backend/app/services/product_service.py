@@ -1,103 +1,237 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.product_repository import ProductRepository
-from app.schemas.product import ProductCreate, ProductItem, ProductSizeDetail, ProductSizeAdd, ProductSizeUpdate
-from app.core.cache.redis import get_redis
-from app.core.constants import REDIS_KEYS
-from typing import List
-import json
+from app.schemas.product import ProductCreate, ProductItem, ProductResponse, ProductFilter, ProductFacets, ProductSizeAdd, ProductSizeUpdate, ProductSizeBatchItem, ProductSizeBatchResult, ProductSizeKey, ProductChangeEvent, ProductChangeType
+from app.core.cache.tiered import cache
+from app.core.config import settings
+from app.core.database.postgresql import async_session_maker
+from app.core.constants import REDIS_KEYS, PRODUCT_STREAM_BATCH_SIZE
+from app.core.search.inverted_index import product_search_index
+from app.core.stock.counters import stock_counters
+from app.core.events.product_changes import product_change_feed, RESYNC_EVENT
+from app.utils.pagination import encode_cursor
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
 
 
 class ProductService:
     def __init__(self, db: AsyncSession):
         self.product_repository = ProductRepository(db)
 
-    async def _invalidate_search_cache(self):
-        redis = await get_redis()
+    async def get_catalog_generation(self) -> int:
+        return await cache.get_generation(REDIS_KEYS["product"]["generation"])
+
+    async def invalidate_search_cache(self):
         try:
-            pattern = REDIS_KEYS["product"]["search"].replace("{query}", "*")
-            cursor = 0
-            while True:
-                cursor, keys = await redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await redis.delete(*keys)
-                if cursor == 0:
-                    break
+            await cache.incr(REDIS_KEYS["product"]["generation"])
         except Exception:
             pass
 
-    def _transform_to_product_item(self, product) -> ProductItem:
-        sizes = [
-            ProductSizeDetail(
-                size_id=product_size.size_id,
-                size_name=product_size.size.name,
-                price=product_size.price,
-                stock=product_size.stock
-            )
-            for product_size in product.product_sizes
-        ]
+    async def publish_changes(self, *events: ProductChangeEvent):
+        if not events:
+            return
+
+        try:
+            await product_change_feed.publish(*(event.model_dump_json(exclude_none=True) for event in events))
+        except Exception:
+            pass
+
+    async def publish_resync(self):
+        try:
+            await product_change_feed.publish(RESYNC_EVENT)
+        except Exception:
+            pass
 
-        return ProductItem(
-            id=product.id,
-            name=product.name,
-            image=product.image,
-            description=product.description,
-            category_id=product.category_id,
-            sizes=sizes
+    def _size_updated_event(self, product_item: ProductItem, size_id: int) -> ProductChangeEvent:
+        size = next((size for size in product_item.sizes or [] if size.size_id == size_id), None)
+        return ProductChangeEvent(
+            type=ProductChangeType.size_updated,
+            product_id=product_item.id,
+            size_id=size_id,
+            price=size.price if size else None,
+            stock=size.stock if size else None
         )
 
-    async def get_products(self) -> List[ProductItem]:
-        products = await self.product_repository.get_products()
-        return [self._transform_to_product_item(product) for product in products]
+    async def refresh_products(self, product_ids: Iterable[int]):
+        product_ids = list(product_ids)
+        if not product_ids:
+            return
+
+        await self.invalidate_search_cache()
+
+        if product_search_index.ready or product_search_index.building:
+            for row in await self.product_repository.get_product_rows_by_ids(product_ids):
+                product_search_index.upsert(ProductItem(**row))
+
+    async def _merge_live_stock(self, product_items: List[ProductItem]) -> List[ProductItem]:
+        if not settings.hot_stock_enabled:
+            return product_items
+
+        skus = [(product_item.id, size.size_id) for product_item in product_items for size in product_item.sizes or []]
+        try:
+            live_stock = await stock_counters.get_stock(skus)
+        except Exception:
+            return product_items
+
+        if not live_stock:
+            return product_items
+
+        return [
+            product_item.model_copy(update={"sizes": [
+                size.model_copy(update={"stock": live_stock.get((product_item.id, size.size_id), size.stock)})
+                for size in product_item.sizes
+            ]}) if product_item.sizes else product_item
+            for product_item in product_items
+        ]
+
+    async def _overwrite_live_stock(self, product_id: int, size_id: int, stock: Optional[int]):
+        if settings.hot_stock_enabled and stock is not None:
+            await stock_counters.overwrite(product_id, size_id, stock)
+
+    async def _overwrite_live_stocks(self, rows: Iterable, skus: Optional[set] = None):
+        if settings.hot_stock_enabled:
+            await stock_counters.overwrite_many(
+                (row["product_id"], row["size_id"], row["stock"])
+                for row in rows
+                if skus is None or (row["product_id"], row["size_id"]) in skus
+            )
+
+    async def get_products(self, filters: ProductFilter, limit: int, after: Optional[dict] = None) -> Tuple[List[ProductItem], Optional[str], Optional[ProductFacets]]:
+        rows = await self.product_repository.get_product_rows(filters, limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["id"], rows[-1].get("sort_key"))
+
+        facets = None
+        if after is None:
+            facets = ProductFacets(**await self.product_repository.get_product_facets(filters))
+
+        product_items = await self._merge_live_stock([ProductItem(**row) for row in rows])
+        return product_items, next_cursor, facets
+
+    async def stream_products(self, filters: ProductFilter, after: Optional[dict] = None) -> AsyncIterator[ProductItem]:
+        batch = []
+        async for row in self.product_repository.stream_product_rows(filters, after):
+            batch.append(ProductItem(**row))
+            if len(batch) >= PRODUCT_STREAM_BATCH_SIZE:
+                for product_item in await self._merge_live_stock(batch):
+                    yield product_item
+                batch = []
+
+        for product_item in await self._merge_live_stock(batch):
+            yield product_item
 
     async def create_product(self, product_data: ProductCreate) -> ProductItem:
         product = await self.product_repository.create_product(product_data)
-        await self._invalidate_search_cache()
-
-        return ProductItem(
-            id=product.id,
-            name=product.name,
-            image=product.image,
-            description=product.description,
-            category_id=product.category_id,
-            sizes=[]
-        )
+        await self.invalidate_search_cache()
+
+        product_item = ProductItem(**product, sizes=[])
+        product_search_index.upsert(product_item)
+        await self.publish_changes(ProductChangeEvent(
+            type=ProductChangeType.product_created,
+            product_id=product_item.id,
+            name=product_item.name,
+            category_id=product_item.category_id
+        ))
+        return product_item
 
     async def add_size_to_product(self, product_id: int, size_data: ProductSizeAdd) -> ProductItem:
         product = await self.product_repository.add_size_to_product(product_id, size_data)
-        await self._invalidate_search_cache()
-        return self._transform_to_product_item(product)
+        await self.invalidate_search_cache()
+        product_item = ProductItem(**product)
+        product_search_index.upsert(product_item)
+        await self.publish_changes(ProductChangeEvent(
+            type=ProductChangeType.size_added,
+            product_id=product_id,
+            size_id=size_data.size_id,
+            price=size_data.price,
+            stock=size_data.stock
+        ))
+        return product_item
+
+    async def delete_product(self, product_id: int) -> ProductItem:
+        product = await self.product_repository.delete_product(product_id)
+        await self.invalidate_search_cache()
+        product_search_index.remove(product_id)
+        await self.publish_changes(ProductChangeEvent(
+            type=ProductChangeType.product_deleted,
+            product_id=product_id
+        ))
+        return ProductItem(**product)
 
     async def delete_size_from_product(self, product_id: int, size_id: int) -> ProductItem:
         product = await self.product_repository.delete_size_from_product(product_id, size_id)
-        await self._invalidate_search_cache()
-        return self._transform_to_product_item(product)
+        await self.invalidate_search_cache()
+        product_item = ProductItem(**product)
+        product_search_index.upsert(product_item)
+        await self.publish_changes(ProductChangeEvent(
+            type=ProductChangeType.size_removed,
+            product_id=product_id,
+            size_id=size_id
+        ))
+        return (await self._merge_live_stock([product_item]))[0]
 
     async def update_product_size(self, product_id: int, size_id: int, size_data: ProductSizeUpdate) -> ProductItem:
-        product = await self.product_repository.update_product_size(product_id, size_id, size_data)
-        await self._invalidate_search_cache()
-        return self._transform_to_product_item(product)
+        product = await self.product_repository.update_product_size(
+            product_id,
+            size_id,
+            size_data,
+            lambda: self._overwrite_live_stock(product_id, size_id, size_data.stock)
+        )
+        await self.invalidate_search_cache()
+        product_item = ProductItem(**product)
+        product_search_index.upsert(product_item)
+        product_item = (await self._merge_live_stock([product_item]))[0]
+        await self.publish_changes(self._size_updated_event(product_item, size_id))
+        return product_item
+
+    async def update_product_sizes_batch(self, items: List[ProductSizeBatchItem]) -> ProductSizeBatchResult:
+        unique_items = list({(item.product_id, item.size_id): item for item in items}.values())
+        stock_keys = {(item.product_id, item.size_id) for item in unique_items if item.stock is not None}
+        updated = await self.product_repository.update_product_sizes_batch(
+            unique_items,
+            lambda rows: self._overwrite_live_stocks(rows, stock_keys)
+        )
+        await self.refresh_products({row["product_id"] for row in updated})
 
-    async def search_products(self, search_query: str) -> List[ProductItem]:
-        cache_key = REDIS_KEYS["product"]["search"].format(query=search_query.lower())
-        redis = await get_redis()
+        updated_keys = {(row["product_id"], row["size_id"]) for row in updated}
 
-        try:
-            cached_data = await redis.get(cache_key)
-            if cached_data:
-                products_data = json.loads(cached_data)
-                print('return from cache#########')
-                return [ProductItem(**item) for item in products_data]
-        except (Exception):
-            pass
+        await self.publish_changes(*(
+            ProductChangeEvent(type=ProductChangeType.size_updated, **row)
+            for row in updated
+        ))
 
-        products = await self.product_repository.search_products(search_query)
-        product_items = [self._transform_to_product_item(product) for product in products]
+        not_found = [
+            ProductSizeKey(product_id=item.product_id, size_id=item.size_id)
+            for item in unique_items
+            if (item.product_id, item.size_id) not in updated_keys
+        ]
 
-        try:
-            serialized_data = json.dumps([item.model_dump() for item in product_items])
-            await redis.setex(cache_key, 300, serialized_data)
-        except (Exception):
-            pass
+        return ProductSizeBatchResult(updated=len(updated), not_found=not_found)
+
+    def _render_product_response(self, product_items: List[ProductItem]) -> str:
+        return ProductResponse(success=True, data=product_items).model_dump_json()
 
-        print('return from db########')
-        return product_items
+    async def _render_search_products(self, search_query: str) -> str:
+        async with async_session_maker() as db:
+            rows = await ProductRepository(db).search_product_rows(search_query)
+            return self._render_product_response([ProductItem(**row) for row in rows])
+
+    async def search_products(self, search_query: str) -> Union[str, bytes]:
+        if product_search_index.ready:
+            product_items = product_search_index.search(search_query)
+            return self._render_product_response(await self._merge_live_stock(product_items))
+
+        try:
+            generation = await self.get_catalog_generation()
+        except Exception:
+            rows = await self.product_repository.search_product_rows(search_query)
+            return self._render_product_response([ProductItem(**row) for row in rows])
+
+        cache_key = REDIS_KEYS["product"]["search"].format(generation=generation, query=search_query.lower())
+        return await cache.get_or_compute(
+            cache_key,
+            lambda: self._render_search_products(search_query),
+            settings.search_cache_soft_ttl,
+            settings.search_cache_hard_ttl
+        )
@@ -2,20 +2,37 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.size_repository import SizeRepository
 from app.schemas.size import SizeCreate, SizeUpdate, SizeItem
 from app.models.size import Size
+from app.core.cache.tiered import cache
+from app.core.search.inverted_index import product_search_index
+from app.core.constants import REDIS_KEYS
 from typing import List
 
 class SizeService:
     def __init__(self, db: AsyncSession):
         self.size_repository = SizeRepository(db)
 
+    async def get_generation(self) -> int:
+        return await cache.get_generation(REDIS_KEYS["size"]["generation"])
+
+    async def _bump_generation(self):
+        try:
+            await cache.incr(REDIS_KEYS["size"]["generation"])
+            await cache.incr(REDIS_KEYS["product"]["generation"])
+        except Exception:
+            pass
+
     async def get_sizes(self) -> List[Size]:
         return await self.size_repository.get_sizes()
 
     async def create_size(self, size_data: SizeCreate) -> Size:
-        return await self.size_repository.create_size(size_data)
+        size = await self.size_repository.create_size(size_data)
+        await self._bump_generation()
+        return size
 
     async def update_size(self, size_id: int, size_data: SizeUpdate) -> SizeItem:
         size = await self.size_repository.update_size(size_id, size_data)
+        await self._bump_generation()
+        product_search_index.rename_size(size.id, size.name)
 
         return SizeItem(
             id=size.id,
@@ -25,6 +42,7 @@ class SizeService:
 
     async def delete_size(self, size_id: int) -> SizeItem:
         size = await self.size_repository.delete_size(size_id)
+        await self._bump_generation()
 
         return SizeItem(
             id=size.id,
@@ -0,0 +1,62 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.repositories.stock_counter_repository import StockCounterRepository
+from app.schemas.stock_reservation import StockCounterItem
+from app.services.product_service import ProductService
+from app.core.stock.counters import stock_counters
+
+
+class StockCounterService:
+    def __init__(self, db: AsyncSession):
+        self.stock_counter_repository = StockCounterRepository(db)
+        self.product_service = ProductService(db)
+
+    async def flag_hot(self, product_id: int, size_id: int) -> StockCounterItem:
+        stock = await self.stock_counter_repository.lock_product_size(product_id, size_id)
+        if stock is None:
+            await self.stock_counter_repository.rollback()
+            raise ValueError(f"Size with id {size_id} not found for this product")
+
+        try:
+            await stock_counters.flag(product_id, size_id, stock)
+        finally:
+            await self.stock_counter_repository.commit()
+
+        live_stock = await stock_counters.get_stock([(product_id, size_id)])
+        return StockCounterItem(
+            product_id=product_id,
+            size_id=size_id,
+            stock=live_stock.get((product_id, size_id), stock),
+            hot=True
+        )
+
+    async def unflag_hot(self, product_id: int, size_id: int) -> StockCounterItem:
+        delta = await stock_counters.unflag(product_id, size_id)
+        if delta:
+            product_ids = await self.stock_counter_repository.increment_stock({(product_id, size_id): delta})
+            await self.product_service.refresh_products(product_ids)
+
+        stock = await self.stock_counter_repository.get_stock(product_id, size_id)
+        if stock is None:
+            raise ValueError(f"Size with id {size_id} not found for this product")
+
+        return StockCounterItem(product_id=product_id, size_id=size_id, stock=stock, hot=False)
+
+    async def flush(self) -> List[int]:
+        batch = await stock_counters.begin_flush()
+        if batch is None:
+            return []
+
+        batch_id, deltas, versions = batch
+        product_ids = None
+        if await self.stock_counter_repository.claim_flush(batch_id, list(deltas)):
+            current_versions = await stock_counters.get_versions(deltas)
+            product_ids = await self.stock_counter_repository.complete_flush({
+                sku: delta for sku, delta in deltas.items()
+                if current_versions[sku] == versions[sku]
+            })
+        await stock_counters.end_flush()
+
+        if product_ids:
+            await self.product_service.refresh_products(product_ids)
+        return product_ids or []
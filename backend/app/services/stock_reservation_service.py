@@ -0,0 +1,143 @@
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Tuple
+from app.repositories.stock_reservation_repository import StockReservationRepository
+from app.repositories.stock_counter_repository import StockCounterRepository
+from app.schemas.stock_reservation import StockChange, StockReservationCreate, StockReservationItem
+from app.schemas.product import ProductChangeEvent, ProductChangeType
+from app.services.product_service import ProductService
+from app.core.config import settings
+from app.core.stock.counters import stock_counters
+from app.utils.exception import InsufficientStockError
+
+
+class StockReservationService:
+    def __init__(self, db: AsyncSession):
+        self.stock_reservation_repository = StockReservationRepository(db)
+        self.stock_counter_repository = StockCounterRepository(db)
+        self.product_service = ProductService(db)
+
+    async def _raise_for_failed_change(self, stock_change: StockChange):
+        if not await self.stock_reservation_repository.product_size_exists(stock_change.product_id, stock_change.size_id):
+            raise ValueError(f"Size with id {stock_change.size_id} not found for this product")
+        raise InsufficientStockError("Insufficient stock")
+
+    async def _credit_stock(self, released: Dict[Tuple[int, int], int]) -> List[int]:
+        uncounted = {}
+        for (product_id, size_id), quantity in released.items():
+            if await stock_counters.increment(product_id, size_id, quantity) is None:
+                uncounted[(product_id, size_id)] = quantity
+
+        return await self.stock_counter_repository.increment_stock(uncounted)
+
+    async def _publish_stock_change(self, stock_item: StockReservationItem) -> StockReservationItem:
+        await self.product_service.publish_changes(ProductChangeEvent(
+            type=ProductChangeType.size_updated,
+            product_id=stock_item.product_id,
+            size_id=stock_item.size_id,
+            stock=stock_item.stock
+        ))
+        return stock_item
+
+    async def decrement_stock(self, stock_change: StockChange) -> StockReservationItem:
+        if settings.hot_stock_enabled:
+            stock = await stock_counters.decrement(stock_change.product_id, stock_change.size_id, stock_change.quantity)
+            if stock is not None:
+                return await self._publish_stock_change(StockReservationItem(**stock_change.model_dump(), stock=stock))
+
+        row = await self.stock_reservation_repository.decrement_stock(
+            stock_change.product_id,
+            stock_change.size_id,
+            stock_change.quantity
+        )
+        if row is None:
+            await self._raise_for_failed_change(stock_change)
+
+        await self.product_service.refresh_products([row["product_id"]])
+        return await self._publish_stock_change(StockReservationItem(**row, quantity=stock_change.quantity))
+
+    async def _reserve_counted_stock(self, reservation_data: StockReservationCreate, stock: int) -> StockReservationItem:
+        try:
+            row = await self.stock_reservation_repository.create_reservation(
+                reservation_data.product_id,
+                reservation_data.size_id,
+                reservation_data.quantity,
+                reservation_data.ttl_seconds
+            )
+        except Exception:
+            await self._credit_stock({(reservation_data.product_id, reservation_data.size_id): reservation_data.quantity})
+            raise
+
+        if row is None:
+            await self._credit_stock({(reservation_data.product_id, reservation_data.size_id): reservation_data.quantity})
+            raise ValueError(f"Size with id {reservation_data.size_id} not found for this product")
+
+        return await self._publish_stock_change(StockReservationItem(
+            **row,
+            product_id=reservation_data.product_id,
+            size_id=reservation_data.size_id,
+            stock=stock
+        ))
+
+    async def reserve_stock(self, reservation_data: StockReservationCreate) -> StockReservationItem:
+        if settings.hot_stock_enabled:
+            stock = await stock_counters.decrement(reservation_data.product_id, reservation_data.size_id, reservation_data.quantity)
+            if stock is not None:
+                return await self._reserve_counted_stock(reservation_data, stock)
+
+        row = await self.stock_reservation_repository.reserve_stock(
+            reservation_data.product_id,
+            reservation_data.size_id,
+            reservation_data.quantity,
+            reservation_data.ttl_seconds
+        )
+        if row is None:
+            await self._raise_for_failed_change(reservation_data)
+
+        await self.product_service.refresh_products([row["product_id"]])
+        return await self._publish_stock_change(StockReservationItem(**row))
+
+    async def commit_reservation(self, reservation_id: UUID) -> StockReservationItem:
+        row = await self.stock_reservation_repository.commit_reservation(reservation_id)
+        if row is None:
+            raise ValueError(f"Reservation with id {reservation_id} not found")
+
+        reservation_item = StockReservationItem(**row)
+        if settings.hot_stock_enabled:
+            live_stock = await stock_counters.get_stock([(reservation_item.product_id, reservation_item.size_id)])
+            reservation_item.stock = live_stock.get((reservation_item.product_id, reservation_item.size_id), reservation_item.stock)
+
+        return reservation_item
+
+    async def release_reservation(self, reservation_id: UUID) -> StockReservationItem:
+        if settings.hot_stock_enabled:
+            row = await self.stock_reservation_repository.delete_reservation(reservation_id)
+            if row is None:
+                raise ValueError(f"Reservation with id {reservation_id} not found")
+
+            sku = (row["product_id"], row["size_id"])
+            product_ids = await self._credit_stock({sku: row["quantity"]})
+            await self.product_service.refresh_products(product_ids)
+
+            live_stock = await stock_counters.get_stock([sku])
+            if sku not in live_stock:
+                live_stock[sku] = await self.stock_counter_repository.get_stock(*sku)
+
+            return await self._publish_stock_change(StockReservationItem(**row, stock=live_stock[sku]))
+
+        row = await self.stock_reservation_repository.release_reservation(reservation_id)
+        if row is None:
+            raise ValueError(f"Reservation with id {reservation_id} not found")
+
+        await self.product_service.refresh_products([row["product_id"]])
+        return await self._publish_stock_change(StockReservationItem(**row))
+
+    async def release_expired_reservations(self) -> List[int]:
+        if settings.hot_stock_enabled:
+            released = await self.stock_reservation_repository.delete_expired_reservations()
+            product_ids = await self._credit_stock(released)
+        else:
+            product_ids = await self.stock_reservation_repository.release_expired_reservations()
+
+        await self.product_service.refresh_products(product_ids)
+        return product_ids
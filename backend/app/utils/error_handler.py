@@ -14,7 +14,7 @@ def get_exception_status_code(exception) -> int:
             return status.HTTP_404_NOT_FOUND
         case "NoResultFound":
             return status.HTTP_404_NOT_FOUND
-        case "IntegrityError" | "ForeignKeyViolationError" | "UniqueViolationError":
+        case "IntegrityError" | "ForeignKeyViolationError" | "UniqueViolationError" | "InsufficientStockError":
             return status.HTTP_409_CONFLICT
         case _:
             return status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -45,6 +45,9 @@ def get_db_error_message(exception, model_name: str = "This record") -> str:
         case "ValueError":
             return f"{model_name} not found"
 
+        case "InsufficientStockError":
+            return "Insufficient stock"
+
         case "NoResultFound":
             return f"{model_name} not found"
 
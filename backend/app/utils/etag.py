@@ -0,0 +1,21 @@
+from typing import Optional
+
+
+def build_etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
@@ -1,11 +1,11 @@
 from fastapi import Request, status
 from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Union
 
 
-async def http_exception_handler(request: Request, exception: HTTPException) -> JSONResponse:
-    return JSONResponse(
+async def http_exception_handler(request: Request, exception: HTTPException) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=exception.status_code,
         content={
             "success": False,
@@ -13,3 +13,7 @@ async def http_exception_handler(request: Request, exception: HTTPException) ->
             "data": None
         }
     )
+
+
+class InsufficientStockError(Exception):
+    pass
@@ -1,12 +1,16 @@
+import hashlib
 import os
 import uuid
 from pathlib import Path
+from typing import BinaryIO
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from app.utils.image_variants import UPLOAD_DIR, schedule_image_variants, image_variants_exist
 
 
-UPLOAD_DIR = Path("uploads/products")
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 MAX_FILE_SIZE = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def generate_unique_filename(original_filename: str) -> str:
@@ -22,21 +26,55 @@ def validate_image_file(file: UploadFile) -> None:
         raise ValueError("Invalid file type")
 
 
+def _write_chunk(output: BinaryIO, digest, chunk: bytes):
+    digest.update(chunk)
+    output.write(chunk)
+
+
+def _store_blob(partial_path: Path, file_path: Path) -> bool:
+    if file_path.exists():
+        partial_path.unlink()
+        os.utime(file_path)
+        return False
+
+    os.replace(partial_path, file_path)
+    return True
+
+
+def generate_content_filename(digest: str, original_filename: str) -> str:
+    extension = Path(original_filename).suffix.lower()
+    return f"{digest}{extension}"
+
+
 async def save_upload_file(file: UploadFile) -> str:
     validate_image_file(file)
 
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise ValueError("File size exceeds 5MB limit")
+
+    await run_in_threadpool(UPLOAD_DIR.mkdir, parents=True, exist_ok=True)
 
-    filename = generate_unique_filename(file.filename)
-    file_path = UPLOAD_DIR / filename
+    partial_path = UPLOAD_DIR / (generate_unique_filename(file.filename) + ".part")
+    digest = hashlib.sha256()
 
-    content = await file.read()
+    output = await run_in_threadpool(open, partial_path, "wb")
+    try:
+        written = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > MAX_FILE_SIZE:
+                raise ValueError("File size exceeds 5MB limit")
+            await run_in_threadpool(_write_chunk, output, digest, chunk)
 
-    if len(content) > MAX_FILE_SIZE:
-        raise ValueError("File size exceeds 5MB limit")
+        await run_in_threadpool(output.close)
 
-    with open(file_path, "wb") as f:
-        f.write(content)
+        filename = generate_content_filename(digest.hexdigest(), file.filename)
+        stored = await run_in_threadpool(_store_blob, partial_path, UPLOAD_DIR / filename)
+    except BaseException:
+        await run_in_threadpool(output.close)
+        await run_in_threadpool(partial_path.unlink, missing_ok=True)
+        raise
 
+    if stored or not await run_in_threadpool(image_variants_exist, filename):
+        schedule_image_variants(filename)
     return filename
-
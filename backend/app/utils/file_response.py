@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+
+    start, _, end = range_header[len("bytes="):].strip().partition("-")
+    try:
+        start = int(start) if start else None
+        end = int(end) if end else None
+    except ValueError:
+        return None
+
+    if start is None:
+        if not end or not size:
+            raise ValueError("Range not satisfiable")
+        return max(size - end, 0), size - 1
+
+    end = min(end, size - 1) if end is not None else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+class RangeFileResponse(Response):
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        media_type: str,
+        headers: dict,
+        byte_range: Optional[Tuple[int, int]] = None
+    ):
+        self.path = path
+        self.media_type = media_type
+        self.background = None
+        self.start, self.end = byte_range or (0, size - 1)
+        self.count = self.end - self.start + 1 if size else 0
+        self.status_code = 206 if byte_range else 200
+        self.whole_file = byte_range is None
+
+        headers = {**headers, "Accept-Ranges": "bytes", "Content-Length": str(self.count)}
+        if byte_range:
+            headers["Content-Range"] = f"bytes {self.start}-{self.end}/{size}"
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        if scope["method"] == "HEAD" or not self.count:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if self.whole_file and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        file = await run_in_threadpool(open, self.path, "rb")
+        try:
+            if "http.response.zerocopysend" in extensions:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": self.start,
+                    "count": self.count
+                })
+                return
+
+            await run_in_threadpool(file.seek, self.start)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await run_in_threadpool(file.read, min(FILE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(file.close)
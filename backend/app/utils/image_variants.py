@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from PIL import Image, ImageOps, features
+from app.core.constants import IMAGE_VARIANT_WIDTHS, IMAGE_VARIANT_FORMATS, IMAGE_PROCESS_WORKERS
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = Path("uploads/products")
+UPLOAD_URL = "/uploads/products"
+SUPPORTED_FORMATS = [image_format for image_format in IMAGE_VARIANT_FORMATS if features.check(image_format)]
+
+_executor: Optional[ProcessPoolExecutor] = None
+_pending: Set[asyncio.Task] = set()
+
+
+def variant_filename(filename: str, variant: str, image_format: str) -> str:
+    return f"{Path(filename).stem}_{variant}.{image_format}"
+
+
+def get_image_variant_paths(filename: str) -> List[Path]:
+    return [
+        UPLOAD_DIR / variant_filename(filename, variant, image_format)
+        for variant in IMAGE_VARIANT_WIDTHS
+        for image_format in SUPPORTED_FORMATS
+    ]
+
+
+def image_variants_exist(filename: str) -> bool:
+    return all(path.exists() for path in get_image_variant_paths(filename))
+
+
+def get_image_variant_urls(filename: str) -> Dict[str, str]:
+    return {variant: f"{UPLOAD_URL}/{Path(filename).stem}_{variant}" for variant in IMAGE_VARIANT_WIDTHS}
+
+
+def _render_variants(source_path: str) -> List[str]:
+    source = Path(source_path)
+    rendered = []
+
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+        for variant, width in IMAGE_VARIANT_WIDTHS.items():
+            resized = image.copy()
+            resized.thumbnail((width, width), Image.Resampling.LANCZOS)
+
+            for image_format in SUPPORTED_FORMATS:
+                target = source.with_name(variant_filename(source.name, variant, image_format))
+                partial = target.with_name(target.name + ".part")
+                resized.save(partial, format=image_format.upper(), quality=80)
+                os.replace(partial, target)
+                rendered.append(target.name)
+
+    return rendered
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+    return _executor
+
+
+async def generate_image_variants(filename: str) -> List[str]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _render_variants, str(UPLOAD_DIR / filename))
+
+
+def _log_variant_failure(task: asyncio.Task):
+    _pending.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Image variant generation failed: {task.exception()}")
+
+
+def schedule_image_variants(filename: str):
+    task = asyncio.create_task(generate_image_variants(filename))
+    _pending.add(task)
+    task.add_done_callback(_log_variant_failure)
+
+
+def shutdown_image_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,34 @@
+import base64
+import json
+from typing import Any, Optional, Tuple
+
+
+def encode_cursor(last_id: int, sort_key: Any = None) -> str:
+    payload = {"id": last_id}
+    if sort_key is not None:
+        payload["key"] = sort_key
+
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], key_types: Tuple[type, ...] = ()) -> Optional[dict]:
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+
+    if key_types:
+        key = payload.get("key")
+        if not isinstance(key, key_types) or isinstance(key, bool):
+            raise ValueError("Invalid cursor")
+
+    return payload
@@ -0,0 +1,9 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
@@ -0,0 +1,198 @@
+import asyncio
+import os
+import statistics
+import time
+from typing import Awaitable, Callable, List, Sequence, Tuple
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+
+BASE_URL = os.getenv("BENCH_BASE_URL", "http://localhost:8000")
+API_URL = f"{BASE_URL}/api/v1"
+
+engine = create_async_engine(settings.database_url, pool_size=20, max_overflow=20)
+session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def report(label: str, samples: Sequence[float], elapsed: float, unit: str = "req"):
+    if not samples:
+        print(f"{label:<40} no samples")
+        return
+
+    print(
+        f"{label:<40} n={len(samples):<7} {len(samples) / elapsed:>10.1f} {unit}/s"
+        f"  p50={percentile(samples, 0.50) * 1000:8.2f}ms"
+        f"  p95={percentile(samples, 0.95) * 1000:8.2f}ms"
+        f"  p99={percentile(samples, 0.99) * 1000:8.2f}ms"
+        f"  mean={statistics.fmean(samples) * 1000:8.2f}ms"
+    )
+
+
+async def timed(operation: Callable[[], Awaitable]) -> float:
+    started = time.perf_counter()
+    await operation()
+    return time.perf_counter() - started
+
+
+async def run_concurrently(
+    operation: Callable[[], Awaitable],
+    concurrency: int,
+    total: int
+) -> Tuple[List[float], float]:
+    samples: List[float] = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            samples.append(await timed(operation))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+async def measure_async(operation: Callable[[], Awaitable], repeat: int) -> Tuple[List[float], float]:
+    samples = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        samples.append(await timed(operation))
+    return samples, time.perf_counter() - started
+
+
+def measure_sync(operation: Callable[[], object], repeat: int) -> Tuple[List[float], float]:
+    samples = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation_started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - operation_started)
+    return samples, time.perf_counter() - started
+
+
+async def login(client: httpx.AsyncClient):
+    response = await client.post(
+        f"{API_URL}/auth/login",
+        json={"username": settings.user_username, "password": settings.user_password}
+    )
+    response.raise_for_status()
+    client.cookies.set("access_token", response.json()["access_token"])
+
+
+def api_client(**kwargs) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=kwargs.pop("max_connections", 100), max_keepalive_connections=None)
+    return httpx.AsyncClient(limits=limits, timeout=kwargs.pop("timeout", 30.0), **kwargs)
+
+
+BENCH_PREFIX = "bench"
+WORDS = [
+    "red", "blue", "green", "black", "cotton", "wool", "leather", "linen", "running", "trail",
+    "jacket", "shirt", "shoe", "boot", "lamp", "desk", "chair", "novel", "guide", "phone",
+    "cable", "charger", "ball", "racket", "kettle", "blanket", "hoodie", "sneaker", "speaker", "tablet",
+]
+
+SEED_PRODUCTS = f"""
+INSERT INTO products (name, description, category_id)
+SELECT
+    '{BENCH_PREFIX} ' || i || ' ' || w[1 + i % cardinality(w)] || ' ' || w[1 + (i * 7) % cardinality(w)],
+    w[1 + (i * 3) % cardinality(w)] || ' ' || w[1 + (i * 11) % cardinality(w)] || ' for everyday use, item ' || i,
+    :category_id
+FROM generate_series(:start, :stop) AS i, (SELECT CAST(:words AS varchar[]) AS w) AS words
+ON CONFLICT (name) DO NOTHING
+"""
+
+SEED_PRODUCT_SIZES = f"""
+INSERT INTO product_sizes (product_id, size_id, price, stock)
+SELECT p.id, s.id, round((10 + random() * 190)::numeric, 2), (random() * 100)::int
+FROM products p
+CROSS JOIN (SELECT id FROM sizes ORDER BY display_order LIMIT 3) AS s
+WHERE p.id BETWEEN :first_id AND :last_id AND p.name LIKE '{BENCH_PREFIX} %'
+ON CONFLICT (product_id, size_id) DO NOTHING
+"""
+
+SEED_BATCH_SIZE = 50_000
+
+
+async def get_bench_category_id(db: AsyncSession) -> int:
+    await db.execute(
+        text("INSERT INTO categories (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"),
+        {"name": BENCH_PREFIX}
+    )
+    return (await db.execute(text("SELECT id FROM categories WHERE name = :name"), {"name": BENCH_PREFIX})).scalar_one()
+
+
+async def count_bench_products(db: AsyncSession) -> int:
+    result = await db.execute(text(f"SELECT count(*) FROM products WHERE name LIKE '{BENCH_PREFIX} %'"))
+    return result.scalar_one()
+
+
+async def seed_products(count: int):
+    async with session_maker() as db:
+        category_id = await get_bench_category_id(db)
+        await db.execute(
+            text(f"DELETE FROM products WHERE substring(name from '^{BENCH_PREFIX} ([0-9]+) ')::int > :count"),
+            {"count": count}
+        )
+        existing = await count_bench_products(db)
+
+        for start in range(existing + 1, count + 1, SEED_BATCH_SIZE):
+            stop = min(start + SEED_BATCH_SIZE - 1, count)
+            ids = await db.execute(
+                text(SEED_PRODUCTS + " RETURNING id"),
+                {"category_id": category_id, "start": start, "stop": stop, "words": WORDS}
+            )
+            ids = ids.scalars().all()
+            if ids:
+                await db.execute(text(SEED_PRODUCT_SIZES), {"first_id": min(ids), "last_id": max(ids)})
+            await db.commit()
+            print(f"seeded {stop}/{count} benchmark products")
+
+        await db.execute(text("ANALYZE products"))
+        await db.execute(text("ANALYZE product_sizes"))
+        await db.execute(text("ANALYZE product_read_models"))
+        await db.commit()
+
+
+async def delete_bench_products():
+    async with session_maker() as db:
+        await db.execute(text(f"DELETE FROM products WHERE name LIKE '{BENCH_PREFIX} %'"))
+        await db.commit()
+
+
+def make_product_items(count: int, sizes_per_product: int = 3) -> list:
+    from app.schemas.product import ProductItem, ProductSizeDetail
+
+    return [
+        ProductItem(
+            id=product_id,
+            name=f"{BENCH_PREFIX} {product_id} {WORDS[product_id % len(WORDS)]}",
+            image=f"{product_id:064x}.jpg",
+            description=f"{WORDS[product_id * 3 % len(WORDS)]} {WORDS[product_id * 11 % len(WORDS)]} for everyday use",
+            category_id=1,
+            sizes=[
+                ProductSizeDetail(size_id=size_id, size_name=f"S{size_id}", price=19.99 + size_id, stock=product_id % 100)
+                for size_id in range(1, sizes_per_product + 1)
+            ]
+        )
+        for product_id in range(1, count + 1)
+    ]
+
+
+async def get_bench_sku() -> tuple:
+    await seed_products(1)
+    async with session_maker() as db:
+        row = (await db.execute(
+            text(
+                "SELECT ps.product_id, ps.size_id FROM product_sizes ps JOIN products p ON p.id = ps.product_id "
+                "WHERE p.name LIKE :prefix ORDER BY ps.size_id LIMIT 1"
+            ),
+            {"prefix": f"{BENCH_PREFIX} 1 %"}
+        )).one()
+    return row.product_id, row.size_id
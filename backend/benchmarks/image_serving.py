@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import hashlib
+import os
+import subprocess
+import sys
+import httpx
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+from app.utils.image_variants import UPLOAD_DIR
+from benchmarks.common import BASE_URL, api_client, report, run_concurrently
+
+STATIC_PORT = 8001
+STATIC_URL = f"http://127.0.0.1:{STATIC_PORT}"
+
+static_app = Starlette(routes=[Mount("/uploads", StaticFiles(directory="uploads"))])
+
+
+def write_image(size: int) -> str:
+    content = os.urandom(size)
+    filename = f"{hashlib.sha256(content).hexdigest()}.jpg"
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    (UPLOAD_DIR / filename).write_bytes(content)
+    return filename
+
+
+async def wait_until_up(url: str):
+    async with httpx.AsyncClient() as client:
+        for _ in range(50):
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"{url} did not come up")
+
+
+async def bench_server(label: str, url: str, concurrency: int, total: int):
+    async with api_client(max_connections=concurrency) as client:
+        first = await client.get(url)
+        first.raise_for_status()
+        etag = first.headers.get("etag")
+
+        cases = [
+            ("full GET", {}),
+            ("If-None-Match", {"If-None-Match": etag} if etag else None),
+            ("Range 64KB", {"Range": "bytes=0-65535"}),
+        ]
+        for case, headers in cases:
+            if headers is None:
+                print(f"{label} {case}: no ETag returned, skipped")
+                continue
+
+            async def fetch():
+                response = await client.get(url, headers=headers)
+                if response.status_code >= 400:
+                    response.raise_for_status()
+
+            samples, elapsed = await run_concurrently(fetch, concurrency, total)
+            report(f"{label} {case}", samples, elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare image throughput of the StaticFiles mount and the image route")
+    parser.add_argument("--size", type=int, default=200 * 1024, help="image size in bytes")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    filename = write_image(args.size)
+    static_server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "benchmarks.image_serving:static_app",
+        "--port", str(STATIC_PORT), "--log-level", "warning"
+    ])
+
+    try:
+        await wait_until_up(STATIC_URL)
+        print(f"serving a {args.size} byte image, {args.concurrency} concurrent clients")
+        await bench_server("StaticFiles mount", f"{STATIC_URL}/uploads/products/{filename}", args.concurrency, args.requests)
+        await bench_server("image route", f"{BASE_URL}/uploads/products/{filename}", args.concurrency, args.requests)
+        await bench_server("image route, negotiated", f"{BASE_URL}/uploads/products/{filename.split('.')[0]}_thumb", args.concurrency, args.requests)
+    finally:
+        static_server.terminate()
+        static_server.wait()
+        (UPLOAD_DIR / filename).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app.models.product import Product
+from app.models.product_size import ProductSize
+from app.repositories.product_repository import ProductRepository
+from app.schemas.product import ProductItem, ProductSizeDetail, ProductFilter
+from benchmarks.common import session_maker, seed_products, delete_bench_products
+
+
+def transform_to_product_item(product: Product) -> ProductItem:
+    sizes = [
+        ProductSizeDetail(
+            size_id=product_size.size_id,
+            size_name=product_size.size.name,
+            price=product_size.price,
+            stock=product_size.stock
+        )
+        for product_size in product.product_sizes
+    ]
+
+    return ProductItem(
+        id=product.id,
+        name=product.name,
+        image=product.image,
+        description=product.description,
+        category_id=product.category_id,
+        sizes=sizes
+    )
+
+
+async def orm_page(db, limit: int, after_id: Optional[int]) -> List[ProductItem]:
+    query = select(Product).options(
+        selectinload(Product.product_sizes).selectinload(ProductSize.size)
+    ).order_by(Product.id).limit(limit)
+
+    if after_id is not None:
+        query = query.where(Product.id > after_id)
+
+    result = await db.execute(query)
+    product_items = [transform_to_product_item(product) for product in result.scalars().all()]
+    db.expunge_all()
+    return product_items
+
+
+async def projection_page(db, limit: int, after_id: Optional[int]) -> List[ProductItem]:
+    after = {"id": after_id} if after_id is not None else None
+    rows = await ProductRepository(db).get_product_rows(ProductFilter(), limit, after)
+    return [ProductItem(**row) for row in rows]
+
+
+async def read_rows(read_page, rows: int, page_size: int) -> float:
+    async with session_maker() as db:
+        after_id = None
+        read = 0
+        started = time.perf_counter()
+        while read < rows:
+            product_items = await read_page(db, min(page_size, rows - read), after_id)
+            if not product_items:
+                break
+            read += len(product_items)
+            after_id = product_items[-1].id
+        elapsed = time.perf_counter() - started
+
+    return read / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare rows/sec of ORM hydration and the column projection listing path")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, nargs="+", default=[100, 1_000])
+    parser.add_argument("--cleanup", action="store_true", help="delete benchmark products afterwards")
+    args = parser.parse_args()
+
+    await seed_products(args.rows)
+
+    for page_size in args.page_size:
+        print(f"\n--- {args.rows} rows, page size {page_size} ---")
+        for label, read_page in [("ORM + selectinload", orm_page), ("column projection", projection_page)]:
+            await read_rows(read_page, min(args.rows, page_size * 10), page_size)
+            rows_per_second = await read_rows(read_page, args.rows, page_size)
+            print(f"{label:<40} {rows_per_second:>10.0f} rows/s")
+
+    if args.cleanup:
+        await delete_bench_products()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
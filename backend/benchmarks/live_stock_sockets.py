@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List
+import websockets
+from benchmarks.common import API_URL, BASE_URL, api_client, login, get_bench_sku, percentile, report
+
+LIVE_URL = BASE_URL.replace("http", "ws", 1) + "/api/v1/products/live"
+IDLE_PRODUCT_ID = 2 ** 31 - 1
+
+
+async def open_sockets(count: int, product_id: int, concurrency: int = 200) -> List:
+    sockets = []
+    connect_times = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def connect():
+        async with semaphore:
+            started = time.perf_counter()
+            websocket = await websockets.connect(LIVE_URL, ping_interval=None, max_queue=None)
+            await websocket.send(json.dumps({"subscribe": [product_id]}))
+            connect_times.append(time.perf_counter() - started)
+            sockets.append(websocket)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connect() for _ in range(count)))
+    report(f"connect + subscribe x{count}", connect_times, time.perf_counter() - started, unit="socket")
+    return sockets
+
+
+async def receive_updates(websocket, sent_at: Dict[int, float], latencies: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        try:
+            message = json.loads(await asyncio.wait_for(websocket.recv(), timeout=1))
+        except asyncio.TimeoutError:
+            continue
+
+        received_at = time.perf_counter()
+        for update in message.get("updates", []):
+            if update.get("stock") in sent_at:
+                latencies.append(received_at - sent_at[update["stock"]])
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure live stock WebSocket fan-out with idle and active sockets")
+    parser.add_argument("--idle", type=int, default=10_000)
+    parser.add_argument("--active", type=int, default=1_000)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=20.0, help="stock updates per second")
+    args = parser.parse_args()
+
+    product_id, size_id = await get_bench_sku()
+
+    idle_sockets = await open_sockets(args.idle, IDLE_PRODUCT_ID)
+    active_sockets = await open_sockets(args.active, product_id)
+
+    sent_at: Dict[int, float] = {}
+    latencies: List[float] = []
+    stop = asyncio.Event()
+    receivers = [asyncio.create_task(receive_updates(websocket, sent_at, latencies, stop)) for websocket in active_sockets]
+
+    async with api_client() as client:
+        await login(client)
+        started = time.perf_counter()
+        for stock in range(1, args.updates + 1):
+            sent_at[stock] = time.perf_counter()
+            response = await client.put(f"{API_URL}/products/{product_id}/sizes/{size_id}", json={"stock": stock})
+            response.raise_for_status()
+            await asyncio.sleep(max(0.0, started + stock / args.rate - time.perf_counter()))
+
+    await asyncio.sleep(2)
+    stop.set()
+    await asyncio.gather(*receivers)
+
+    expected = args.updates * len(active_sockets)
+    print(f"{len(idle_sockets)} idle and {len(active_sockets)} active sockets, {args.updates} updates at {args.rate}/s")
+    print(f"delivered {len(latencies)} of {expected} update messages ({expected - len(latencies)} coalesced or lost)")
+    if latencies:
+        print(
+            f"delivery latency p50={percentile(latencies, 0.50) * 1000:.2f}ms"
+            f"  p95={percentile(latencies, 0.95) * 1000:.2f}ms"
+            f"  p99={percentile(latencies, 0.99) * 1000:.2f}ms"
+        )
+
+    await asyncio.gather(*(websocket.close() for websocket in idle_sockets + active_sockets), return_exceptions=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
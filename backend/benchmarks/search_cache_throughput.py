@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+import json
+import httpx
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from app.schemas.product import ProductItem, ProductResponse
+from app.core.constants import PRODUCT_SEARCH_LIMIT
+from benchmarks.common import API_URL, api_client, make_product_items, report, run_concurrently
+
+
+def build_app(cached_body: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/revalidated", response_model=ProductResponse, response_class=JSONResponse)
+    async def revalidated():
+        return ProductResponse(success=True, data=[ProductItem(**item) for item in json.loads(cached_body)["data"]])
+
+    @app.get("/raw")
+    async def raw():
+        return Response(content=cached_body, media_type="application/json")
+
+    return app
+
+
+async def bench_in_process(results: int, total: int):
+    cached_body = ProductResponse(success=True, data=make_product_items(results)).model_dump_json()
+    print(f"cached search body: {results} products, {len(cached_body)} bytes")
+
+    transport = httpx.ASGITransport(app=build_app(cached_body))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path in [("cache hit, re-validated model", "/revalidated"), ("cache hit, raw bytes", "/raw")]:
+            await client.get(path)
+            samples, elapsed = await run_concurrently(lambda: client.get(path), 1, total)
+            report(label, samples, elapsed)
+
+
+async def bench_live(query: str, concurrency: int, total: int):
+    async with api_client(max_connections=concurrency) as client:
+        async def search():
+            response = await client.get(f"{API_URL}/products/search", params={"search_query": query})
+            response.raise_for_status()
+
+        await search()
+        samples, elapsed = await run_concurrently(search, concurrency, total)
+        report(f"GET /products/search?search_query={query}", samples, elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare requests/sec of re-validated and raw cached search responses")
+    parser.add_argument("--results", type=int, default=PRODUCT_SEARCH_LIMIT)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--live", metavar="QUERY", help="also hit the running API's /products/search with this query")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    await bench_in_process(args.results, args.requests)
+    if args.live:
+        await bench_live(args.live, args.concurrency, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+from typing import List
+from sqlalchemy import select, or_
+from sqlalchemy.orm import selectinload
+from app.models.product import Product
+from app.models.product_size import ProductSize
+from app.repositories.product_repository import ProductRepository
+from benchmarks.common import session_maker, seed_products, delete_bench_products, measure_async, report
+
+QUERIES = ["jacket", "red cotton", "leath", "jaket", "sneaker 4217", "everyday"]
+
+
+async def ilike_search(db, query_text: str) -> List[Product]:
+    search_pattern = f"%{query_text}%"
+    query = select(Product).options(
+        selectinload(Product.product_sizes).selectinload(ProductSize.size)
+    ).where(
+        or_(Product.name.ilike(search_pattern),
+        Product.description.ilike(search_pattern)
+        )
+    )
+
+    result = await db.execute(query)
+
+    return result.scalars().all()
+
+
+async def read_model_search(db, query_text: str):
+    return await ProductRepository(db).search_product_rows(query_text)
+
+
+async def bench_size(rows: int, repeat: int):
+    await seed_products(rows)
+    print(f"\n--- {rows} products ---")
+
+    for label, search in [("ilike + ORM", ilike_search), ("tsvector + pg_trgm", read_model_search)]:
+        async with session_maker() as db:
+            for query_text in QUERIES:
+                async def run_query():
+                    await search(db, query_text)
+                    db.expunge_all()
+
+                await run_query()
+                samples, elapsed = await measure_async(run_query, repeat)
+                report(f"{label} '{query_text}'", samples, elapsed, unit="query")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare product search latency of the ilike path and the read model search")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true", help="delete benchmark products afterwards")
+    args = parser.parse_args()
+
+    for rows in sorted(args.rows):
+        await bench_size(rows, args.repeat)
+
+    if args.cleanup:
+        await delete_bench_products()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
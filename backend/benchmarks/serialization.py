@@ -0,0 +1,56 @@
+import argparse
+import asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+from app.schemas.product import ProductResponse
+from app.utils.response import ModelResponse
+from benchmarks.common import make_product_items, report, run_concurrently
+
+
+def build_app(response: ProductResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json", response_model=ProductResponse, response_class=JSONResponse)
+    async def stdlib_json():
+        return response
+
+    @app.get("/orjson", response_model=ProductResponse, response_class=ORJSONResponse)
+    async def orjson():
+        return response
+
+    @app.get("/model", response_model=ProductResponse)
+    async def model():
+        return ModelResponse(response)
+
+    return app
+
+
+async def bench_size(products: int, total: int):
+    response = ProductResponse(success=True, data=make_product_items(products))
+    print(f"\n--- {products} products ---")
+
+    transport = httpx.ASGITransport(app=build_app(response))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for label, path in [
+            ("response_model + JSONResponse", "/json"),
+            ("response_model + ORJSONResponse", "/orjson"),
+            ("ModelResponse (no re-validation)", "/model"),
+        ]:
+            await client.get(path)
+            samples, elapsed = await run_concurrently(lambda: client.get(path), 1, total)
+            report(label, samples, elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare response serialization paths for ProductItem lists")
+    parser.add_argument("--products", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    for products in args.products:
+        await bench_size(products, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
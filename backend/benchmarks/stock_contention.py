@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import time
+from benchmarks.common import API_URL, api_client, login, get_bench_sku, timed, report
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Hammer one SKU with concurrent buyers until it sells out")
+    parser.add_argument("--buyers", type=int, default=500)
+    parser.add_argument("--stock", type=int, default=20_000)
+    parser.add_argument("--reserve", action="store_true", help="reserve and commit instead of decrementing directly")
+    parser.add_argument("--hot", action="store_true", help="flag the SKU as hot so it is served from Redis counters")
+    args = parser.parse_args()
+
+    product_id, size_id = await get_bench_sku()
+
+    async with api_client(max_connections=args.buyers, timeout=120.0) as client:
+        await login(client)
+        if args.hot:
+            (await client.put(f"{API_URL}/stock/hot/{product_id}/{size_id}")).raise_for_status()
+        (await client.put(f"{API_URL}/products/{product_id}/sizes/{size_id}", json={"stock": args.stock})).raise_for_status()
+
+        samples = []
+        conflicts = 0
+        errors = 0
+        sold_out = False
+        change = {"product_id": product_id, "size_id": size_id, "quantity": 1}
+
+        async def buy():
+            if not args.reserve:
+                return await client.post(f"{API_URL}/stock/decrement", json=change)
+
+            response = await client.post(f"{API_URL}/stock/reservations", json=change)
+            if response.status_code != 201:
+                return response
+            return await client.post(f"{API_URL}/stock/reservations/{response.json()['data']['id']}/commit")
+
+        async def buyer():
+            nonlocal conflicts, errors, sold_out
+            while not sold_out:
+                response = None
+
+                async def attempt():
+                    nonlocal response
+                    response = await buy()
+
+                elapsed = await timed(attempt)
+                if response.status_code == 409:
+                    conflicts += 1
+                    sold_out = True
+                elif response.status_code >= 400:
+                    errors += 1
+                    return
+                else:
+                    samples.append(elapsed)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(buyer() for _ in range(args.buyers)))
+        elapsed = time.perf_counter() - started
+
+        if args.hot:
+            (await client.delete(f"{API_URL}/stock/hot/{product_id}/{size_id}")).raise_for_status()
+
+    mode = "reserve + commit" if args.reserve else "decrement"
+    report(f"{args.buyers} buyers, {mode}", samples, elapsed, unit="sale")
+    print(f"sold {len(samples)} of {args.stock}, {conflicts} sold-out responses, {errors} errors")
+    if len(samples) != args.stock:
+        print("WARNING: units sold does not match the starting stock")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import List
+from sqlalchemy import text
+from benchmarks.common import API_URL, session_maker, get_bench_category_id, api_client, login, timed, report
+
+UPLOAD_PREFIX = "upload-bench"
+
+
+async def read_products(client, stop: asyncio.Event, samples: List[float]):
+    async def get_products():
+        response = await client.get(f"{API_URL}/products/", params={"limit": 20})
+        response.raise_for_status()
+
+    while not stop.is_set():
+        samples.append(await timed(get_products))
+
+
+async def upload_images(client, category_id: int, size: int, stop: asyncio.Event, samples: List[float]):
+    async def upload():
+        response = await client.post(
+            f"{API_URL}/products/",
+            data={"name": f"{UPLOAD_PREFIX} {uuid.uuid4().hex}", "category_id": str(category_id)},
+            files={"image": ("bench.jpg", os.urandom(size), "image/jpeg")}
+        )
+        response.raise_for_status()
+
+    while not stop.is_set():
+        samples.append(await timed(upload))
+
+
+async def run_phase(label: str, duration: float, readers: int, uploaders: int, category_id: int, upload_size: int):
+    read_samples: List[float] = []
+    upload_samples: List[float] = []
+    stop = asyncio.Event()
+
+    async with api_client(max_connections=readers + uploaders, timeout=120.0) as client:
+        await login(client)
+        tasks = [asyncio.create_task(read_products(client, stop, read_samples)) for _ in range(readers)]
+        tasks += [
+            asyncio.create_task(upload_images(client, category_id, upload_size, stop, upload_samples))
+            for _ in range(uploaders)
+        ]
+
+        started = time.perf_counter()
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    report(f"{label}: GET /products/", read_samples, elapsed)
+    if uploaders:
+        report(f"{label}: POST /products/ ({upload_size >> 20}MB)", upload_samples, elapsed, unit="upload")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure API read latency while large uploads are in progress")
+    parser.add_argument("--uploads", type=int, default=50, help="concurrent uploads")
+    parser.add_argument("--readers", type=int, default=10, help="concurrent readers")
+    parser.add_argument("--upload-size", type=int, default=5 * 1024 * 1024 - 1024)
+    parser.add_argument("--duration", type=float, default=30.0)
+    args = parser.parse_args()
+
+    async with session_maker() as db:
+        category_id = await get_bench_category_id(db)
+        await db.commit()
+
+    try:
+        await run_phase("idle", args.duration, args.readers, 0, category_id, args.upload_size)
+        await run_phase(f"{args.uploads} uploads", args.duration, args.readers, args.uploads, category_id, args.upload_size)
+    finally:
+        async with session_maker() as db:
+            await db.execute(text("DELETE FROM products WHERE name LIKE :prefix"), {"prefix": f"{UPLOAD_PREFIX} %"})
+            await db.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
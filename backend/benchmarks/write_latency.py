@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+from sqlalchemy import select, text
+from sqlalchemy.orm import selectinload
+from app.models.product import Product
+from app.models.product_size import ProductSize
+from app.repositories.product_repository import ProductRepository
+from app.schemas.product import ProductSizeAdd, ProductSizeUpdate
+from benchmarks.common import API_URL, BENCH_PREFIX, session_maker, seed_products, api_client, login, measure_async, report
+
+
+async def _load_product(db, product_id: int) -> Product:
+    query = select(Product).options(
+        selectinload(Product.product_sizes).selectinload(ProductSize.size)
+    ).where(Product.id == product_id)
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def _load_product_size(db, product_id: int, size_id: int) -> ProductSize:
+    if (await db.execute(select(Product).where(Product.id == product_id))).scalar_one_or_none() is None:
+        raise ValueError(f"Product with id {product_id} not found")
+
+    query = select(ProductSize).where(ProductSize.product_id == product_id, ProductSize.size_id == size_id)
+    product_size = (await db.execute(query)).scalar_one_or_none()
+    if product_size is None:
+        raise ValueError(f"Size with id {size_id} not found for this product")
+    return product_size
+
+
+async def orm_add_size(db, product_id: int, size_data: ProductSizeAdd) -> Product:
+    if (await db.execute(select(Product).where(Product.id == product_id))).scalar_one_or_none() is None:
+        raise ValueError(f"Product with id {product_id} not found")
+
+    db.add(ProductSize(product_id=product_id, **size_data.model_dump()))
+    await db.commit()
+    return await _load_product(db, product_id)
+
+
+async def orm_update_size(db, product_id: int, size_id: int, size_data: ProductSizeUpdate) -> Product:
+    product_size = await _load_product_size(db, product_id, size_id)
+    for field, value in size_data.model_dump(exclude_none=True).items():
+        setattr(product_size, field, value)
+
+    await db.commit()
+    return await _load_product(db, product_id)
+
+
+async def orm_delete_size(db, product_id: int, size_id: int) -> Product:
+    await db.delete(await _load_product_size(db, product_id, size_id))
+    await db.commit()
+    return await _load_product(db, product_id)
+
+
+async def get_bench_target() -> tuple:
+    await seed_products(1)
+    async with session_maker() as db:
+        product_id = (await db.execute(
+            text("SELECT id FROM products WHERE name LIKE :prefix ORDER BY id LIMIT 1"),
+            {"prefix": f"{BENCH_PREFIX} 1 %"}
+        )).scalar_one()
+        size_id = (await db.execute(
+            text(
+                "SELECT id FROM sizes WHERE id NOT IN (SELECT size_id FROM product_sizes WHERE product_id = :product_id) "
+                "ORDER BY display_order LIMIT 1"
+            ),
+            {"product_id": product_id}
+        )).scalar_one()
+    return product_id, size_id
+
+
+async def bench_repository(product_id: int, size_id: int, repeat: int):
+    add = ProductSizeAdd(size_id=size_id, price=10.0, stock=5)
+    change = ProductSizeUpdate(price=12.5, stock=7)
+
+    async with session_maker() as db:
+        repository = ProductRepository(db)
+        paths = {
+            "ORM load/modify/reload": (
+                lambda: orm_add_size(db, product_id, add),
+                lambda: orm_update_size(db, product_id, size_id, change),
+                lambda: orm_delete_size(db, product_id, size_id),
+            ),
+            "single statement": (
+                lambda: repository.add_size_to_product(product_id, add),
+                lambda: repository.update_product_size(product_id, size_id, change),
+                lambda: repository.delete_size_from_product(product_id, size_id),
+            ),
+        }
+
+        for label, (add_size, update_size, delete_size) in paths.items():
+            samples = {"add": [], "update": [], "delete": []}
+            for _ in range(repeat):
+                for name, operation in [("add", add_size), ("update", update_size), ("delete", delete_size)]:
+                    operation_samples, _ = await measure_async(operation, 1)
+                    samples[name] += operation_samples
+                db.expunge_all()
+
+            for name, operation_samples in samples.items():
+                report(f"{label} {name}", operation_samples, sum(operation_samples), unit="write")
+
+
+async def bench_api(product_id: int, size_id: int, repeat: int):
+    async with api_client() as client:
+        await login(client)
+        url = f"{API_URL}/products/{product_id}/sizes"
+        operations = [
+            ("POST /products/{id}/sizes", lambda: client.post(url, json={"size_id": size_id, "price": 10.0, "stock": 5})),
+            ("PUT /products/{id}/sizes/{size}", lambda: client.put(f"{url}/{size_id}", json={"price": 12.5, "stock": 7})),
+            ("DELETE /products/{id}/sizes/{size}", lambda: client.delete(f"{url}/{size_id}")),
+        ]
+
+        samples = {label: [] for label, _ in operations}
+        for _ in range(repeat):
+            for label, operation in operations:
+                operation_samples, _ = await measure_async(lambda: _checked(operation), 1)
+                samples[label] += operation_samples
+
+        for label, operation_samples in samples.items():
+            report(label, operation_samples, sum(operation_samples), unit="write")
+
+
+async def _checked(operation):
+    response = await operation()
+    response.raise_for_status()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure product size write latency")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--api", action="store_true", help="measure through the running API instead of the repository")
+    args = parser.parse_args()
+
+    product_id, size_id = await get_bench_target()
+    if args.api:
+        await bench_api(product_id, size_id, args.repeat)
+    else:
+        await bench_repository(product_id, size_id, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
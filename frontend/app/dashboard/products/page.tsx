@@ -291,7 +291,7 @@ export default function ProductsPage() {
                   <td className="px-6 py-4 text-sm text-gray-900">
                     {product.image ? (
                       <img
-                        src={`http://localhost:8000/uploads/products/${product.image}`}
+                        src={`http://localhost:8000${product.image_variants?.thumb ?? `/uploads/products/${product.image}`}`}
                         alt={product.name}
                         className="w-16 h-16 object-cover rounded"
                       />
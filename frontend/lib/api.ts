@@ -81,8 +81,24 @@ export const api = {
 
   products: {
     getAll: async (): Promise<ApiResponse<Product[]>> => {
-      const response = await axiosInstance.get("/products");
-      return response.data;
+      const products: Product[] = [];
+      let after: string | undefined;
+
+      do {
+        const response = await axiosInstance.get("/products", {
+          params: { limit: 500, after },
+        });
+        const page: ApiResponse<Product[]> = response.data;
+
+        if (!page.success) {
+          return page;
+        }
+
+        products.push(...(page.data ?? []));
+        after = page.next_cursor ?? undefined;
+      } while (after);
+
+      return { success: true, data: products };
     },
 
     search: async (searchQuery: string): Promise<ApiResponse<Product[]>> => {
@@ -2,6 +2,7 @@ export interface ApiResponse<T> {
   success: boolean;
   message?: string;
   data?: T;
+  next_cursor?: string | null;
 }
 
 export interface Category {
@@ -32,6 +33,7 @@ export interface Product {
   id: number;
   name: string;
   image?: string;
+  image_variants?: Record<string, string>;
   description?: string;
   category_id: number;
   sizes?: ProductSize[];